@@ -0,0 +1,197 @@
+"""In-process caching for read-mostly catalog data.
+
+Hero, skill, gear and stat tables only change when the seeding scripts run,
+so list responses are cached in memory with a short TTL instead of querying
+Supabase on every request.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import partial
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+from weakref import WeakSet
+
+from fastapi import Response
+from pydantic import TypeAdapter
+
+logger = logging.getLogger(__name__)
+
+Loader = Callable[[], Awaitable[Any]]
+
+
+@dataclass(slots=True)
+class _Entry:
+    expires_at: float
+    loaded_at: float
+    accessed_at: float
+    value: Any
+    loader: Optional[Loader]
+
+
+class TTLCache:
+    """Bounded least-recently-used cache whose entries expire after ``ttl``.
+
+    Expired entries are kept until evicted so they can be served if reloading
+    them fails (stale-on-error), keeping catalog endpoints up while Supabase
+    is unreachable. ``None`` results are not cached, so lookups of missing
+    records are retried instead of crowding out real entries.
+
+    Loads are single-flight: concurrent misses for the same key share one
+    loader call, so a burst of identical requests costs one database query.
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 256) -> None:
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: OrderedDict[Hashable, _Entry] = OrderedDict()
+        self._pending: Dict[Hashable, asyncio.Future[Any]] = {}
+        _caches.add(self)
+
+    async def get_or_load(self, key: Hashable, loader: Loader) -> Any:
+        """Return the cached value for ``key``, loading it when missing or expired.
+
+        Args:
+            key: Cache key, typically the endpoint name and its query parameters.
+            loader: Coroutine factory producing a fresh value.
+
+        Returns:
+            The cached or freshly loaded value. Loader errors propagate only
+            when there is no previous value to fall back on.
+        """
+        now = time.monotonic()
+        entry = self._entries.get(key)
+        if entry is not None:
+            entry.accessed_at = now
+            if entry.expires_at > now:
+                self._entries.move_to_end(key)
+                return entry.value
+
+        try:
+            return await self._load(key, loader)
+        except Exception:
+            if entry is not None:
+                return entry.value
+            raise
+
+    def set(self, key: Hashable, value: Any, loader: Optional[Loader] = None) -> None:
+        """Store ``value`` under ``key`` with a fresh expiry.
+
+        Args:
+            key: Cache key.
+            value: Value to cache.
+            loader: Coroutine factory used to refresh the entry in the background.
+        """
+        now = time.monotonic()
+        self._entries[key] = _Entry(now + self.ttl, now, now, value, loader)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    async def refresh_due(self, within: float) -> None:
+        """Reload entries expiring within ``within`` seconds that are still in use.
+
+        Only entries read since they were last loaded are refreshed, so keys
+        nobody asks for any more are left to expire instead of being reloaded
+        forever. Failed reloads keep the previous value.
+
+        Args:
+            within: Look-ahead window in seconds.
+        """
+        deadline = time.monotonic() + within
+        for key, entry in list(self._entries.items()):
+            if entry.loader is None or entry.expires_at > deadline:
+                continue
+            if entry.accessed_at <= entry.loaded_at:
+                continue
+            try:
+                await self._load(key, entry.loader)
+            except Exception:
+                logger.warning("Failed to refresh cache entry %r", key, exc_info=True)
+
+    async def _load(self, key: Hashable, loader: Loader) -> Any:
+        """Load and store ``key``, joining a load already in flight for it."""
+        pending = self._pending.get(key)
+        if pending is None:
+            pending = asyncio.ensure_future(self._load_and_store(key, loader))
+            self._pending[key] = pending
+            pending.add_done_callback(partial(self._forget_pending, key))
+        # Shielded so one cancelled request does not cancel the shared load
+        return await asyncio.shield(pending)
+
+    async def _load_and_store(self, key: Hashable, loader: Loader) -> Any:
+        value = await loader()
+        if value is not None:
+            self.set(key, value, loader)
+        return value
+
+    def _forget_pending(self, key: Hashable, future: asyncio.Future[Any]) -> None:
+        if self._pending.get(key) is future:
+            del self._pending[key]
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        self._entries.clear()
+
+
+_caches: WeakSet[TTLCache] = WeakSet()
+
+
+def clear_caches() -> None:
+    """Drop the entries of every cache.
+
+    Entries keep the loader that produced them, and loaders close over the
+    Supabase client of the app that created them. Clearing on shutdown stops
+    a later app in the same process (a second test client, a reload) from
+    refreshing through a closed client.
+    """
+    for cache in list(_caches):
+        cache.clear()
+
+
+async def run_cache_refresher(interval: float = 5.0) -> None:
+    """Refresh in-use entries of every cache ahead of expiry until cancelled.
+
+    Args:
+        interval: Seconds between refresh passes.
+    """
+    while True:
+        await asyncio.sleep(interval)
+        for cache in list(_caches):
+            await cache.refresh_due(within=interval)
+
+
+async def cached_json_response(
+    cache: TTLCache,
+    key: Hashable,
+    build: Callable[[], Awaitable[Any]],
+    adapter: Optional[TypeAdapter[Any]] = None,
+) -> Response:
+    """Serve a response model from ``cache`` as pre-serialized JSON bytes.
+
+    Cache hits skip both the database and Pydantic serialization. Exceptions
+    raised by ``build`` (such as a 404 ``HTTPException``) are not cached.
+
+    Args:
+        cache: Cache holding serialized response bodies.
+        key: Cache key for this request.
+        build: Coroutine factory producing the response body on a miss.
+        adapter: Serializer for bodies that are not a single model, such as
+            lists of models.
+
+    Returns:
+        JSON response with the cached body.
+    """
+
+    async def load() -> bytes:
+        value = await build()
+        if adapter is not None:
+            return adapter.dump_json(value, by_alias=True)
+        return value.model_dump_json(by_alias=True).encode()
+
+    body = await cache.get_or_load(key, load)
+    return Response(content=body, media_type="application/json")
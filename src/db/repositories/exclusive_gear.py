@@ -10,7 +10,7 @@ from postgrest.types import CountMethod
 from src.db.repository_base import BaseRepository
 from src.db.utils import slugify
 from src.schemas.exclusive_gear import HeroExclusiveGearResponse
-from supabase import Client
+from supabase import AsyncClient
 
 
 class ExclusiveGearRepository(BaseRepository[HeroExclusiveGearResponse]):
@@ -23,7 +23,7 @@ class ExclusiveGearRepository(BaseRepository[HeroExclusiveGearResponse]):
         "expedition_skill_effect",
     )
 
-    def __init__(self, client: Client) -> None:
+    def __init__(self, client: AsyncClient) -> None:
         super().__init__(client, "hero_exclusive_gear", HeroExclusiveGearResponse)
 
     _GEAR_COLUMNS = "name, image_path"
@@ -51,7 +51,7 @@ class ExclusiveGearRepository(BaseRepository[HeroExclusiveGearResponse]):
         f"skills:hero_exclusive_gear_skills({_SKILL_COLUMNS})"
     )
 
-    def list_filtered(
+    async def list_filtered(
         self,
         *,
         hero_slug: Optional[str] = None,
@@ -79,13 +79,13 @@ class ExclusiveGearRepository(BaseRepository[HeroExclusiveGearResponse]):
         upper_bound = max(offset + limit - 1, offset)
         query = query.range(offset, upper_bound)
 
-        response = query.execute()
+        response = await query.execute()
         records = self._cast_response(response)
         processed = self._post_process(records)
         total = int(response.count or 0)
         return self._to_models(processed), total
 
-    def list_by_hero_slug(self, hero_slug: str) -> List[Dict[str, Any]]:
+    async def list_by_hero_slug(self, hero_slug: str) -> List[Dict[str, Any]]:
         """Return exclusive gear for a specific hero by slug."""
 
         # Use join with !inner to filter by hero_id_slug
@@ -97,7 +97,7 @@ class ExclusiveGearRepository(BaseRepository[HeroExclusiveGearResponse]):
             .order("level", foreign_table="hero_exclusive_gear_levels")
             .order("battle_type", foreign_table="hero_exclusive_gear_skills")
         )
-        response = query.execute()
+        response = await query.execute()
         records = self._cast_response(response)
         processed = self._post_process(records)
         return self._to_models(processed)
@@ -130,13 +130,12 @@ class ExclusiveGearRepository(BaseRepository[HeroExclusiveGearResponse]):
             gear["conquest_skill"] = conquest_skill
             gear["expedition_skill"] = expedition_skill
 
-            # Add default fields that don't exist in database
-            gear.setdefault("is_unlocked", False)
-            gear.setdefault("current_level", 0)
+            # is_unlocked/current_level are not selected by these queries;
+            # HeroExclusiveGearResponse defaults them
 
         return records
 
-    def get_progression(self, hero_slug: str) -> Optional[Dict[str, Any]]:
+    async def get_progression(self, hero_slug: str) -> Optional[Dict[str, Any]]:
         """Return summarized progression info for a hero's exclusive gear."""
 
         query = (
@@ -150,7 +149,7 @@ class ExclusiveGearRepository(BaseRepository[HeroExclusiveGearResponse]):
             .eq("hero.hero_id_slug", hero_slug)
             .single()
         )
-        response = query.execute()
+        response = await query.execute()
         gear = response.data
         if not gear:
             return None
@@ -2,6 +2,7 @@
 
 from typing import Any, Dict, List, Optional, cast
 
+from src.db.repository_base import _list_adapter
 from src.schemas.governor_gear import (
     GovernorGear,
     GovernorGearCharmLevel,
@@ -9,13 +10,16 @@ from src.schemas.governor_gear import (
     GovernorGearLevel,
     GovernorGearWithCharms,
 )
-from supabase import Client
+from supabase import AsyncClient
+
+# Columns GovernorGear serializes; the audit timestamps are never fetched
+_GEAR_COLUMNS = "gear_id, slot, troop_type, max_charms, description, default_bonus_keys"
 
 
 class GovernorGearRepository:
     """Repository for managing Governor Gear data."""
 
-    def __init__(self, supabase: Client):
+    def __init__(self, supabase: AsyncClient):
         """Initialize Governor Gear repository with Supabase client.
 
         Args:
@@ -38,15 +42,15 @@ class GovernorGearRepository:
         Returns:
             List of governor gear pieces
         """
-        query = self.supabase.table("governor_gear").select("*")
+        query = self.supabase.table("governor_gear").select(_GEAR_COLUMNS)
 
         if troop_type:
             query = query.eq("troop_type", troop_type)
 
-        response = query.order("gear_id").execute()
+        response = await query.order("gear_id").execute()
         data = cast(List[Dict[str, Any]], response.data or [])
 
-        return [GovernorGear.model_validate(item) for item in data]
+        return _list_adapter(GovernorGear).validate_python(data)
 
     async def get_gear_by_id(self, gear_id: str) -> Optional[GovernorGear]:
         """Get specific governor gear piece by ID.
@@ -57,9 +61,9 @@ class GovernorGearRepository:
         Returns:
             Governor gear piece or None if not found
         """
-        response = (
+        response = await (
             self.supabase.table("governor_gear")
-            .select("*")
+            .select(_GEAR_COLUMNS)
             .eq("gear_id", gear_id)
             .execute()
         )
@@ -121,10 +125,10 @@ class GovernorGearRepository:
 
         query = query.gte("level", min_level).lte("level", max_level)
 
-        response = query.order("level").execute()
+        response = await query.order("level").execute()
         data = cast(List[Dict[str, Any]], response.data or [])
 
-        return [GovernorGearLevel.model_validate(item) for item in data]
+        return _list_adapter(GovernorGearLevel).validate_python(data)
 
     async def get_level_by_id(self, level: int) -> Optional[GovernorGearLevel]:
         """Get specific governor gear level data.
@@ -135,7 +139,7 @@ class GovernorGearRepository:
         Returns:
             Governor gear level data or None if not found
         """
-        response = (
+        response = await (
             self.supabase.table("governor_gear_levels")
             .select("*")
             .eq("level", level)
@@ -156,7 +160,7 @@ class GovernorGearRepository:
         Returns:
             List of governor gear levels for that rarity
         """
-        response = (
+        response = await (
             self.supabase.table("governor_gear_levels")
             .select("*")
             .eq("rarity", rarity)
@@ -166,7 +170,7 @@ class GovernorGearRepository:
 
         data = cast(List[Dict[str, Any]], response.data or [])
 
-        return [GovernorGearLevel.model_validate(item) for item in data]
+        return _list_adapter(GovernorGearLevel).validate_python(data)
 
     # =========================================================================
     # Governor Gear Charm Slots
@@ -188,9 +192,9 @@ class GovernorGearRepository:
         if troop_type:
             query = query.eq("troop_type", troop_type)
 
-        response = query.order("gear_id").order("slot_index").execute()
+        response = await query.order("gear_id").order("slot_index").execute()
         data = cast(List[Dict[str, Any]], response.data or [])
-        return [GovernorGearCharmSlot.model_validate(item) for item in data]
+        return _list_adapter(GovernorGearCharmSlot).validate_python(data)
 
     async def get_charm_slots_by_gear(
         self, gear_id: str
@@ -203,7 +207,7 @@ class GovernorGearRepository:
         Returns:
             List of charm slots for that gear piece
         """
-        response = (
+        response = await (
             self.supabase.table("governor_gear_charm_slots")
             .select("*")
             .eq("gear_id", gear_id)
@@ -212,7 +216,7 @@ class GovernorGearRepository:
         )
 
         data = cast(List[Dict[str, Any]], response.data or [])
-        return [GovernorGearCharmSlot.model_validate(item) for item in data]
+        return _list_adapter(GovernorGearCharmSlot).validate_python(data)
 
     # =========================================================================
     # Governor Gear Charm Levels
@@ -230,7 +234,7 @@ class GovernorGearRepository:
         Returns:
             List of charm levels ordered by level
         """
-        response = (
+        response = await (
             self.supabase.table("governor_gear_charm_levels")
             .select("*")
             .gte("level", min_level)
@@ -240,7 +244,7 @@ class GovernorGearRepository:
         )
 
         data = cast(List[Dict[str, Any]], response.data or [])
-        return [GovernorGearCharmLevel.model_validate(item) for item in data]
+        return _list_adapter(GovernorGearCharmLevel).validate_python(data)
 
     async def get_charm_level_by_id(
         self, level: int
@@ -253,7 +257,7 @@ class GovernorGearRepository:
         Returns:
             Charm level data or None if not found
         """
-        response = (
+        response = await (
             self.supabase.table("governor_gear_charm_levels")
             .select("*")
             .eq("level", level)
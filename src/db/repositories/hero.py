@@ -4,22 +4,26 @@ from __future__ import annotations
 
 from typing import Any, Dict, List, Optional, Tuple, cast
 
+from src.cache import TTLCache
 from src.db.repository_base import BaseRepository
 from src.schemas.hero import HeroBasicResponse
-from supabase import Client
+from supabase import AsyncClient
+
+# Heroes only change when the seed scripts run; every /heroes/{slug}/* request
+# resolves its slug through this cache instead of a database round trip.
+_hero_cache = TTLCache(ttl=300, maxsize=512)
 
 
 class HeroRepository(BaseRepository[HeroBasicResponse]):
     """Encapsulate hero data access."""
 
-    def __init__(self, client: Client) -> None:
-        super().__init__(client, "heroes", HeroBasicResponse)
+    # Skip sources, search_vector and audit timestamps; the API never returns them
+    select_columns = "id, hero_id_slug, name, rarity, generation, class, image_path"
 
-    def list_all(self) -> List[HeroBasicResponse]:
-        """Return all heroes with their basic attributes."""
-        return self.get_all(order_by="name")
+    def __init__(self, client: AsyncClient) -> None:
+        super().__init__(client, "heroes", HeroBasicResponse)
 
-    def list_filtered(
+    async def list_filtered(
         self,
         *,
         generation: Optional[int] = None,
@@ -38,13 +42,23 @@ class HeroRepository(BaseRepository[HeroBasicResponse]):
         if hero_class is not None:
             filters["class"] = hero_class
 
-        return self.get_filtered(
+        return await self.get_filtered(
             filters=filters,
             limit=limit,
             offset=offset,
             order_by="name",
         )
 
-    def get_by_slug(self, hero_slug: str) -> Optional[HeroBasicResponse]:
+    async def get_by_slug(self, hero_slug: str) -> Optional[HeroBasicResponse]:
         """Return a single hero by slug or None when it does not exist."""
-        return self.get_by_id("hero_id_slug", hero_slug)
+        return await _hero_cache.get_or_load(
+            hero_slug, lambda: self.get_by_id("hero_id_slug", hero_slug)
+        )
+
+    async def warm_cache(self) -> None:
+        """Load every hero into the slug lookup cache."""
+        for hero in await self.get_all(order_by="name"):
+            slug = hero.hero_id_slug
+            _hero_cache.set(
+                slug, hero, lambda slug=slug: self.get_by_id("hero_id_slug", slug)
+            )
@@ -7,37 +7,56 @@ from typing import Any, Dict, List, Optional, Tuple, cast
 from src.db.repository_base import BaseRepository
 from src.db.utils import slugify
 from src.schemas.skills import HeroSkillResponse
-from supabase import Client
+from supabase import AsyncClient
 
 
 class SkillsRepository(BaseRepository[HeroSkillResponse]):
     """Encapsulate hero skills data access."""
 
-    _SELECT_WITH_HERO = "*, levels:hero_skill_levels(*), hero:heroes!hero_skills_hero_id_fkey(hero_id_slug, name)"
-    _SELECT_WITH_HERO_INNER = "*, levels:hero_skill_levels(*), hero:heroes!hero_skills_hero_id_fkey!inner(hero_id_slug, name)"
-
-    def __init__(self, client: Client) -> None:
+    def __init__(self, client: AsyncClient) -> None:
         super().__init__(client, "hero_skills", HeroSkillResponse)
 
-    def list_filtered(
+    @staticmethod
+    def _select(*, levels_inner: bool = False, hero_inner: bool = False) -> str:
+        """Build the select clause embedding skill levels and the owning hero.
+
+        Inner joins drop skills whose embedded rows are filtered out, so
+        filters on ``levels`` or ``hero`` also restrict the skills returned.
+        """
+
+        levels = "hero_skill_levels!inner" if levels_inner else "hero_skill_levels"
+        hero = (
+            "heroes!hero_skills_hero_id_fkey!inner"
+            if hero_inner
+            else "heroes!hero_skills_hero_id_fkey"
+        )
+        return f"*, levels:{levels}(*), hero:{hero}(hero_id_slug, name)"
+
+    async def list_filtered(
         self,
         *,
         hero_slug: Optional[str] = None,
         skill_type: Optional[str] = None,
         battle_type: Optional[str] = None,
+        level: Optional[int] = None,
         limit: int = 50,
         offset: int = 0,
     ) -> Tuple[List[HeroSkillResponse], int]:
-        """Return skills filtered and paginated server-side."""
+        """Return skills filtered and paginated server-side.
+
+        When ``level`` is given, only that level is embedded and skills without
+        it are dropped by an inner join, so pagination and ``total`` count
+        matching skills only.
+        """
 
-        select_clause = (
-            self._SELECT_WITH_HERO_INNER if hero_slug else self._SELECT_WITH_HERO
+        select_clause = self._select(
+            levels_inner=level is not None, hero_inner=bool(hero_slug)
         )
         query = (
             self.client.table(self.table_name)
             .select(select_clause, count="exact")
             .order("name")
-            .order("level", foreign_table="hero_skill_levels")
+            .order("level", foreign_table="levels")
         )
 
         if hero_slug:
@@ -49,41 +68,44 @@ class SkillsRepository(BaseRepository[HeroSkillResponse]):
         if battle_type:
             query = query.eq("battle_type", battle_type)
 
+        if level is not None:
+            query = query.eq("levels.level", level)
+
         upper_bound = max(offset + limit - 1, offset)
         query = query.range(offset, upper_bound)
 
-        response = query.execute()
+        response = await query.execute()
         records = self._cast_response(response)
         hydrated = self._hydrate(records)
         total = int(response.count or 0)
         return self._to_models(hydrated), total
 
-    def list_by_hero(self, hero_id: str) -> List[HeroSkillResponse]:
+    async def list_by_hero(self, hero_id: str) -> List[HeroSkillResponse]:
         """Return skills for a specific hero by UUID."""
 
         query = (
             self.client.table(self.table_name)
-            .select(self._SELECT_WITH_HERO)
+            .select(self._select())
             .eq("hero_id", hero_id)
             .order("name")
-            .order("level", foreign_table="hero_skill_levels")
+            .order("level", foreign_table="levels")
         )
-        response = query.execute()
+        response = await query.execute()
         records = self._cast_response(response)
         hydrated = self._hydrate(records)
         return self._to_models(hydrated)
 
-    def list_by_hero_slug(self, hero_slug: str) -> List[HeroSkillResponse]:
+    async def list_by_hero_slug(self, hero_slug: str) -> List[HeroSkillResponse]:
         """Return skills for a specific hero by slug."""
 
         query = (
             self.client.table(self.table_name)
-            .select(self._SELECT_WITH_HERO_INNER)
+            .select(self._select(hero_inner=True))
             .eq("hero.hero_id_slug", slugify(hero_slug))
             .order("name")
-            .order("level", foreign_table="hero_skill_levels")
+            .order("level", foreign_table="levels")
         )
-        response = query.execute()
+        response = await query.execute()
         records = self._cast_response(response)
         hydrated = self._hydrate(records)
         return self._to_models(hydrated)
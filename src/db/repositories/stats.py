@@ -9,21 +9,25 @@ from postgrest.types import CountMethod
 from src.db.repository_base import BaseRepository
 from src.db.utils import slugify
 from src.schemas.stats import ConquestStatsResponse, ExpeditionStatsResponse
-from supabase import Client
+from supabase import AsyncClient
 
 
 class HeroConquestStatsRepository(BaseRepository[ConquestStatsResponse]):
-    """Encapsulate conquest stat queries."""
+    """Encapsulate conquest stat queries.
+
+    The hero join only drives filtering and ordering; its embedded payload is
+    left on the rows and dropped by model validation (extra keys are ignored).
+    """
 
     _JOIN_SELECT = (
         "attack, defense, health, "
         "hero:heroes!hero_conquest_stats_hero_id_fkey(hero_id_slug, name)"
     )
 
-    def __init__(self, client: Client) -> None:
+    def __init__(self, client: AsyncClient) -> None:
         super().__init__(client, "hero_conquest_stats", ConquestStatsResponse)
 
-    def list_filtered(
+    async def list_filtered(
         self,
         *,
         hero_slug: Optional[str] = None,
@@ -44,13 +48,12 @@ class HeroConquestStatsRepository(BaseRepository[ConquestStatsResponse]):
         upper_bound = max(offset + limit - 1, offset)
         query = query.range(offset, upper_bound)
 
-        response = query.execute()
+        response = await query.execute()
         data = self._cast_response(response)
-        self._strip_join_payload(data)
         total = int(response.count or 0)
         return self._to_models(data), total
 
-    def list_by_hero(self, hero_id: str) -> List[ConquestStatsResponse]:
+    async def list_by_hero(self, hero_id: str) -> List[ConquestStatsResponse]:
         """Return conquest stats for a specific hero by UUID."""
 
         query = (
@@ -59,11 +62,11 @@ class HeroConquestStatsRepository(BaseRepository[ConquestStatsResponse]):
             .eq("hero_id", hero_id)
             .order("attack")
         )
-        response = query.execute()
+        response = await query.execute()
         data = self._cast_response(response)
         return self._to_models(data)
 
-    def list_by_hero_slug(self, hero_slug: str) -> List[ConquestStatsResponse]:
+    async def list_by_hero_slug(self, hero_slug: str) -> List[ConquestStatsResponse]:
         """Return conquest stats for a specific hero by slug."""
 
         query = (
@@ -75,17 +78,10 @@ class HeroConquestStatsRepository(BaseRepository[ConquestStatsResponse]):
             .eq("heroes.hero_id_slug", slugify(hero_slug))
             .order("attack")
         )
-        response = query.execute()
+        response = await query.execute()
         data = self._cast_response(response)
-        self._strip_join_payload(data)
         return self._to_models(data)
 
-    @staticmethod
-    def _strip_join_payload(records: List[dict]) -> None:
-        for stat in records:
-            stat.pop("hero", None)
-            stat.pop("heroes", None)
-
 
 class HeroExpeditionStatsRepository(BaseRepository[ExpeditionStatsResponse]):
     """Encapsulate expedition stat queries."""
@@ -95,10 +91,10 @@ class HeroExpeditionStatsRepository(BaseRepository[ExpeditionStatsResponse]):
         "hero:heroes!hero_expedition_stats_hero_id_fkey(hero_id_slug, name)"
     )
 
-    def __init__(self, client: Client) -> None:
+    def __init__(self, client: AsyncClient) -> None:
         super().__init__(client, "hero_expedition_stats", ExpeditionStatsResponse)
 
-    def list_filtered(
+    async def list_filtered(
         self,
         *,
         hero_slug: Optional[str] = None,
@@ -119,13 +115,12 @@ class HeroExpeditionStatsRepository(BaseRepository[ExpeditionStatsResponse]):
         upper_bound = max(offset + limit - 1, offset)
         query = query.range(offset, upper_bound)
 
-        response = query.execute()
+        response = await query.execute()
         data = self._cast_response(response)
-        self._strip_join_payload(data)
         total = int(response.count or 0)
         return self._to_models(data), total
 
-    def list_by_hero(self, hero_id: str) -> List[ExpeditionStatsResponse]:
+    async def list_by_hero(self, hero_id: str) -> List[ExpeditionStatsResponse]:
         """Return expedition stats for a specific hero by UUID."""
 
         query = (
@@ -134,11 +129,11 @@ class HeroExpeditionStatsRepository(BaseRepository[ExpeditionStatsResponse]):
             .eq("hero_id", hero_id)
             .order("troop_type")
         )
-        response = query.execute()
+        response = await query.execute()
         data = self._cast_response(response)
         return self._to_models(data)
 
-    def list_by_hero_slug(self, hero_slug: str) -> List[ExpeditionStatsResponse]:
+    async def list_by_hero_slug(self, hero_slug: str) -> List[ExpeditionStatsResponse]:
         """Return expedition stats for a specific hero by slug."""
 
         query = (
@@ -150,13 +145,6 @@ class HeroExpeditionStatsRepository(BaseRepository[ExpeditionStatsResponse]):
             .eq("heroes.hero_id_slug", slugify(hero_slug))
             .order("troop_type")
         )
-        response = query.execute()
+        response = await query.execute()
         data = self._cast_response(response)
-        self._strip_join_payload(data)
         return self._to_models(data)
-
-    @staticmethod
-    def _strip_join_payload(records: List[dict]) -> None:
-        for stat in records:
-            stat.pop("hero", None)
-            stat.pop("heroes", None)
@@ -9,7 +9,7 @@ from postgrest.types import CountMethod
 from src.db.repository_base import BaseRepository
 from src.db.utils import slugify
 from src.schemas.talent import HeroTalentResponse
-from supabase import Client
+from supabase import AsyncClient
 
 
 class TalentRepository(BaseRepository[HeroTalentResponse]):
@@ -21,10 +21,10 @@ class TalentRepository(BaseRepository[HeroTalentResponse]):
     )
     _SELECT_COLUMNS_INNER = f"{_BASE_COLUMNS}, hero:heroes!hero_talents_hero_id_fkey!inner(hero_id_slug, name)"
 
-    def __init__(self, client: Client) -> None:
+    def __init__(self, client: AsyncClient) -> None:
         super().__init__(client, "hero_talents", HeroTalentResponse)
 
-    def list_filtered(
+    async def list_filtered(
         self,
         *,
         hero_slug: Optional[str] = None,
@@ -48,13 +48,13 @@ class TalentRepository(BaseRepository[HeroTalentResponse]):
         upper_bound = max(offset + limit - 1, offset)
         query = query.range(offset, upper_bound)
 
-        response = query.execute()
+        response = await query.execute()
         records = self._cast_response(response)
         hydrated = self._hydrate(records)
         total = int(response.count or 0)
         return self._to_models(hydrated), total
 
-    def list_by_hero(self, hero_id: str) -> List[HeroTalentResponse]:
+    async def list_by_hero(self, hero_id: str) -> List[HeroTalentResponse]:
         """Return talents for a specific hero by UUID."""
 
         query = (
@@ -63,12 +63,12 @@ class TalentRepository(BaseRepository[HeroTalentResponse]):
             .eq("hero_id", hero_id)
             .order("name")
         )
-        response = query.execute()
+        response = await query.execute()
         records = self._cast_response(response)
         hydrated = self._hydrate(records)
         return self._to_models(hydrated)
 
-    def list_by_hero_slug(self, hero_slug: str) -> List[HeroTalentResponse]:
+    async def list_by_hero_slug(self, hero_slug: str) -> List[HeroTalentResponse]:
         """Return talents for a specific hero by slug."""
 
         query = (
@@ -77,7 +77,7 @@ class TalentRepository(BaseRepository[HeroTalentResponse]):
             .eq("hero.hero_id_slug", slugify(hero_slug))
             .order("name")
         )
-        response = query.execute()
+        response = await query.execute()
         records = self._cast_response(response)
         hydrated = self._hydrate(records)
         return self._to_models(hydrated)
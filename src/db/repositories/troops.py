@@ -1,16 +1,25 @@
 """Repository for troops data access."""
 
-from typing import Any, Dict, List, Optional
+import asyncio
+from collections import defaultdict
+from typing import Any, DefaultDict, Dict, List, Optional, Tuple
 
 from src.db.repository_base import BaseRepository
 from src.schemas.troops import Troop, TroopType
-from supabase import Client
+from supabase import AsyncClient
+
+# Columns backing the Troop schema; timestamps and image_path are never
+# returned by the API, so they are not fetched.
+_TROOP_COLUMNS = (
+    "id, troop_type, troop_level, true_gold_level, attack, defense, health, "
+    "lethality, power, load, speed, training_time_seconds, training_power"
+)
 
 
 class TroopsRepository(BaseRepository[Troop]):
     """Repository for managing troops data."""
 
-    def __init__(self, client: Client):
+    def __init__(self, client: AsyncClient):
         """Initialize Troops repository with Supabase client.
 
         Args:
@@ -18,7 +27,7 @@ class TroopsRepository(BaseRepository[Troop]):
         """
         super().__init__(client, "troops", Troop)
 
-    def get_all(
+    async def get_all(
         self,
         *,
         filters: Optional[Dict[str, Any]] = None,
@@ -51,7 +60,7 @@ class TroopsRepository(BaseRepository[Troop]):
         tg_min = min(min_tg, max_tg)
         tg_max = max(min_tg, max_tg)
 
-        query = self.client.table(self.table_name).select("*")
+        query = self.client.table(self.table_name).select(_TROOP_COLUMNS)
 
         if filters:
             for field, value in filters.items():
@@ -70,15 +79,13 @@ class TroopsRepository(BaseRepository[Troop]):
         if limit:
             query = query.limit(limit)
 
-        response = query.execute()
+        response = await query.execute()
         data = self._cast_response(response)
 
-        for troop in data:
-            self._enrich_troop_data(troop)
-
+        await self._attach_enrichment(data)
         return self._to_models(data)
 
-    def get_by_configuration(
+    async def get_by_configuration(
         self, troop_type: TroopType, troop_level: int, true_gold_level: int = 0
     ) -> Optional[Troop]:
         """Get specific troop configuration including enrichment data.
@@ -92,9 +99,9 @@ class TroopsRepository(BaseRepository[Troop]):
             Troop data or None if not found
         """
 
-        response = (
+        response = await (
             self.client.table(self.table_name)
-            .select("*")
+            .select(_TROOP_COLUMNS)
             .eq("troop_type", troop_type.value)
             .eq("troop_level", troop_level)
             .eq("true_gold_level", true_gold_level)
@@ -107,36 +114,50 @@ class TroopsRepository(BaseRepository[Troop]):
             return None
 
         troop = records[0]
-        self._enrich_troop_data(troop)
+        await self._attach_enrichment([troop])
         return self._to_model(troop)
 
-    def _get_enrichment_data(self, troop: Dict[str, Any]) -> Dict[str, Any]:
-        """Fetch training costs and event points for a troop entry."""
+    async def _attach_enrichment(self, troops: List[Dict[str, Any]]) -> None:
+        """Attach training costs and event points onto troop records.
 
-        costs_response = (
-            self.client.table("troop_training_costs")
-            .select("resource_id, cost")
-            .eq("troop_type", troop["troop_type"])
-            .eq("troop_level", troop["troop_level"])
-            .execute()
-        )
-        costs_data = self._cast_response(costs_response)
-        training_costs = {item["resource_id"]: item["cost"] for item in costs_data}
+        Both depend only on troop type and level, so they are fetched for every
+        configuration in ``troops`` with one query per table rather than two
+        queries per row, and matched back by (troop_type, troop_level).
+
+        Args:
+            troops: Raw troop records, updated in place
+        """
+
+        if not troops:
+            return
 
-        events_response = (
+        troop_types = sorted({troop["troop_type"] for troop in troops})
+        troop_levels = sorted({troop["troop_level"] for troop in troops})
+
+        costs_response, events_response = await asyncio.gather(
+            self.client.table("troop_training_costs")
+            .select("troop_type, troop_level, resource_id, cost")
+            .in_("troop_type", troop_types)
+            .in_("troop_level", troop_levels)
+            .execute(),
             self.client.table("troop_event_points")
-            .select("event_id, base_points")
-            .eq("troop_type", troop["troop_type"])
-            .eq("troop_level", troop["troop_level"])
-            .execute()
+            .select("troop_type, troop_level, event_id, base_points")
+            .in_("troop_type", troop_types)
+            .in_("troop_level", troop_levels)
+            .execute(),
         )
-        events_data = self._cast_response(events_response)
-        event_points = {item["event_id"]: item["base_points"] for item in events_data}
 
-        return {"training_costs": training_costs, "event_points": event_points}
+        training_costs: DefaultDict[Tuple[str, int], Dict[str, Any]] = defaultdict(dict)
+        for item in self._cast_response(costs_response):
+            key = (item["troop_type"], item["troop_level"])
+            training_costs[key][item["resource_id"]] = item["cost"]
 
-    def _enrich_troop_data(self, troop: Dict[str, Any]) -> None:
-        """Attach enrichment metadata (costs/events) onto a troop record."""
+        event_points: DefaultDict[Tuple[str, int], Dict[str, Any]] = defaultdict(dict)
+        for item in self._cast_response(events_response):
+            key = (item["troop_type"], item["troop_level"])
+            event_points[key][item["event_id"]] = item["base_points"]
 
-        enrichment = self._get_enrichment_data(troop)
-        troop.update(enrichment)
+        for troop in troops:
+            key = (troop["troop_type"], troop["troop_level"])
+            troop["training_costs"] = training_costs.get(key, {})
+            troop["event_points"] = event_points.get(key, {})
@@ -4,13 +4,13 @@ from typing import List, Optional
 
 from src.db.repository_base import BaseRepository
 from src.schemas.vip import VIPLevel
-from supabase import Client
+from supabase import AsyncClient
 
 
 class VIPRepository(BaseRepository[VIPLevel]):
     """Repository for managing VIP levels data."""
 
-    def __init__(self, client: Client):
+    def __init__(self, client: AsyncClient):
         """Initialize VIP repository with Supabase client.
 
         Args:
@@ -18,7 +18,7 @@ class VIPRepository(BaseRepository[VIPLevel]):
         """
         super().__init__(client, "vip_levels", VIPLevel)
 
-    def get_all(self, min_level: int = 1, max_level: int = 12) -> List[VIPLevel]:
+    async def get_all(self, min_level: int = 1, max_level: int = 12) -> List[VIPLevel]:
         """Get all VIP levels with optional range filtering.
 
         Args:
@@ -28,12 +28,12 @@ class VIPRepository(BaseRepository[VIPLevel]):
         Returns:
             List of VIP levels ordered by level
         """
-        records, _ = self.get_filtered(
+        records, _ = await self.get_filtered(
             range_filters={"level": (min_level, max_level)}, order_by="level"
         )
         return records
 
-    def get_by_level(self, level: int) -> Optional[VIPLevel]:
+    async def get_by_level(self, level: int) -> Optional[VIPLevel]:
         """Get specific VIP level data.
 
         Args:
@@ -42,4 +42,4 @@ class VIPRepository(BaseRepository[VIPLevel]):
         Returns:
             VIP level data or None if not found
         """
-        return self.get_by_id("level", level)
+        return await self.get_by_id("level", level)
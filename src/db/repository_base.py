@@ -2,16 +2,23 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Any, Dict, Generic, List, Optional, Type, TypeVar, cast
 
 from postgrest.types import CountMethod
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
-from supabase import Client
+from supabase import AsyncClient
 
 T = TypeVar("T", bound=BaseModel)
 
 
+@lru_cache(maxsize=None)
+def _list_adapter(model_class: Type[BaseModel]) -> TypeAdapter:
+    """Return a cached adapter validating a list of ``model_class`` in one call."""
+    return TypeAdapter(List[model_class])  # type: ignore[valid-type]
+
+
 class BaseRepository(Generic[T]):
     """Base repository providing common database operations.
 
@@ -20,9 +27,15 @@ class BaseRepository(Generic[T]):
     - Single item lookups
     - List operations
     - Pydantic model validation
+
+    Subclasses can narrow ``select_columns`` to the columns their model needs
+    so PostgREST does not ship unused data (JSON blobs, search vectors, audit
+    timestamps) over the wire.
     """
 
-    def __init__(self, client: Client, table_name: str, model_class: Type[T]):
+    select_columns: str = "*"
+
+    def __init__(self, client: AsyncClient, table_name: str, model_class: Type[T]):
         """Initialize repository.
 
         Args:
@@ -65,9 +78,10 @@ class BaseRepository(Generic[T]):
         Returns:
             List of validated Pydantic model instances
         """
-        return [self._to_model(item) for item in data]
+        # One pydantic-core call for the whole list instead of one per row
+        return _list_adapter(self.model_class).validate_python(data)
 
-    def get_all(
+    async def get_all(
         self,
         *,
         filters: Optional[Dict[str, Any]] = None,
@@ -84,7 +98,11 @@ class BaseRepository(Generic[T]):
         Returns:
             List of model instances
         """
-        query = self.client.table(self.table_name).select("*").order(order_by)
+        query = (
+            self.client.table(self.table_name)
+            .select(self.select_columns)
+            .order(order_by)
+        )
 
         if filters:
             for field, value in filters.items():
@@ -94,11 +112,11 @@ class BaseRepository(Generic[T]):
         if limit:
             query = query.limit(limit)
 
-        response = query.execute()
+        response = await query.execute()
         data = self._cast_response(response)
         return self._to_models(data)
 
-    def get_by_id(self, id_field: str, id_value: Any) -> Optional[T]:
+    async def get_by_id(self, id_field: str, id_value: Any) -> Optional[T]:
         """Get single record by ID field.
 
         Args:
@@ -108,9 +126,9 @@ class BaseRepository(Generic[T]):
         Returns:
             Model instance or None if not found
         """
-        response = (
+        response = await (
             self.client.table(self.table_name)
-            .select("*")
+            .select(self.select_columns)
             .eq(id_field, id_value)
             .execute()
         )
@@ -120,7 +138,7 @@ class BaseRepository(Generic[T]):
             return self._to_model(data[0])
         return None
 
-    def get_filtered(
+    async def get_filtered(
         self,
         *,
         filters: Optional[Dict[str, Any]] = None,
@@ -131,7 +149,7 @@ class BaseRepository(Generic[T]):
     ) -> tuple[List[T], int]:
         query = (
             self.client.table(self.table_name)
-            .select("*", count=CountMethod.exact)
+            .select(self.select_columns, count=CountMethod.exact)
             .order(order_by)
         )
 
@@ -154,7 +172,7 @@ class BaseRepository(Generic[T]):
             upper_bound = max(offset + limit - 1, offset)
             query = query.range(offset, upper_bound)
 
-        response = query.execute()
+        response = await query.execute()
         data = self._cast_response(response)
         total = int(response.count or 0)
 
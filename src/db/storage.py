@@ -60,12 +60,24 @@ def build_public_asset_url(
     bucket_name = bucket or get_storage_bucket()
     _ensure_bucket(bucket_name)
 
+    return _format_public_url(base_url, bucket_name, path)
+
+
+@lru_cache(maxsize=4096)
+def _format_public_url(base_url: str, bucket_name: str, path: str) -> str:
+    """Join a public asset URL (cached: the same paths recur across responses)."""
+
     normalized = path.lstrip("/")
     return f"{base_url}/{bucket_name}/{normalized}"
 
 
+@lru_cache(maxsize=4096)
 def _asset_exists(relative_path: str) -> bool:
-    """Check whether an asset exists locally (used for fallback detection)."""
+    """Check whether an asset exists locally (used for fallback detection).
+
+    Results are cached: local assets ship with the app and do not change
+    while it runs, and every serialized image would otherwise stat them.
+    """
 
     asset_dir = _ASSET_IMAGE_ROOT
     if not asset_dir.is_dir():
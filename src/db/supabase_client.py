@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from functools import lru_cache
-from typing import Any
+from typing import Any, Tuple
 
 from src.settings import get_supabase_settings
 
@@ -12,6 +12,22 @@ class SupabaseClientError(RuntimeError):
     """Raised when the Supabase client cannot be initialized."""
 
 
+def _resolve_credentials() -> Tuple[str, str]:
+    """Return the Supabase URL and access token from settings.
+
+    Raises:
+        SupabaseClientError: If no access token is configured.
+    """
+
+    settings = get_supabase_settings()
+    token = settings.access_token
+    if token is None:
+        raise SupabaseClientError(
+            "Supabase credentials are missing. Provide SUPABASE_SERVICE_ROLE_KEY or SUPABASE_ANON_KEY."
+        )
+    return str(settings.url).rstrip("/"), token
+
+
 @lru_cache(maxsize=1)
 def get_supabase_client() -> Any:
     """Create and memoize the Supabase client instance.
@@ -23,12 +39,7 @@ def get_supabase_client() -> Any:
         SupabaseClientError: If the client cannot be created.
     """
 
-    settings = get_supabase_settings()
-    token = settings.access_token
-    if token is None:
-        raise SupabaseClientError(
-            "Supabase credentials are missing. Provide SUPABASE_SERVICE_ROLE_KEY or SUPABASE_ANON_KEY."
-        )
+    supabase_url, token = _resolve_credentials()
 
     try:
         from supabase import create_client
@@ -38,7 +49,6 @@ def get_supabase_client() -> Any:
         ) from exc
 
     try:
-        supabase_url = str(settings.url).rstrip("/")
         client = create_client(supabase_url, token)
     except Exception as exc:  # pragma: no cover - network/auth errors
         raise SupabaseClientError(
@@ -46,3 +56,37 @@ def get_supabase_client() -> Any:
         ) from exc
 
     return client
+
+
+@lru_cache(maxsize=1)
+def get_async_supabase_client() -> Any:
+    """Create and memoize the async Supabase client used by the API.
+
+    The client authenticates with the configured API key, so it is built with
+    the plain constructor rather than ``acreate_client`` (which only adds a
+    user-session lookup) and can be created outside of a running event loop.
+
+    Returns:
+        AsyncClient: The configured async Supabase client.
+
+    Raises:
+        SupabaseClientError: If the client cannot be created.
+    """
+
+    supabase_url, token = _resolve_credentials()
+
+    try:
+        from supabase import AsyncClient
+    except ImportError as exc:  # pragma: no cover - depends on installation
+        raise SupabaseClientError(
+            "The 'supabase' package is not installed. Install project dependencies before running the app."
+        ) from exc
+
+    try:
+        client = AsyncClient(supabase_url, token)
+    except Exception as exc:  # pragma: no cover - invalid URL/keys
+        raise SupabaseClientError(
+            "Failed to initialize the Supabase client. Check the configured URL and keys."
+        ) from exc
+
+    return client
@@ -14,15 +14,15 @@ from src.db.repositories.talent import TalentRepository
 from src.db.repositories.troops import TroopsRepository
 from src.db.repositories.vip import VIPRepository
 from src.db.supabase_client import SupabaseClientError
-from src.db.supabase_client import get_supabase_client as _get_supabase_client
-from supabase import Client
+from src.db.supabase_client import get_async_supabase_client
+from supabase import AsyncClient
 
 
-def get_supabase_client() -> Client:
-    """Return the Supabase client instance ready for injection."""
+def get_supabase_client() -> AsyncClient:
+    """Return the async Supabase client instance ready for injection."""
 
     try:
-        client = _get_supabase_client()
+        client = get_async_supabase_client()
     except (
         SupabaseClientError,
         RuntimeError,
@@ -36,63 +36,63 @@ def get_supabase_client() -> Client:
 
 
 def get_vip_repository(
-    supabase: Client = Depends(get_supabase_client),
+    supabase: AsyncClient = Depends(get_supabase_client),
 ) -> VIPRepository:
     """Dependency injection for VIP repository."""
     return VIPRepository(supabase)
 
 
 def get_troops_repository(
-    supabase: Client = Depends(get_supabase_client),
+    supabase: AsyncClient = Depends(get_supabase_client),
 ) -> TroopsRepository:
     """Dependency injection for Troops repository."""
     return TroopsRepository(supabase)
 
 
 def get_hero_repository(
-    supabase: Client = Depends(get_supabase_client),
+    supabase: AsyncClient = Depends(get_supabase_client),
 ) -> HeroRepository:
     """Dependency injection for Hero repository."""
     return HeroRepository(supabase)
 
 
 def get_skills_repository(
-    supabase: Client = Depends(get_supabase_client),
+    supabase: AsyncClient = Depends(get_supabase_client),
 ) -> SkillsRepository:
     """Dependency injection for Skills repository."""
     return SkillsRepository(supabase)
 
 
 def get_conquest_stats_repository(
-    supabase: Client = Depends(get_supabase_client),
+    supabase: AsyncClient = Depends(get_supabase_client),
 ) -> HeroConquestStatsRepository:
     """Dependency injection for conquest stats repository."""
     return HeroConquestStatsRepository(supabase)
 
 
 def get_expedition_stats_repository(
-    supabase: Client = Depends(get_supabase_client),
+    supabase: AsyncClient = Depends(get_supabase_client),
 ) -> HeroExpeditionStatsRepository:
     """Dependency injection for expedition stats repository."""
     return HeroExpeditionStatsRepository(supabase)
 
 
 def get_talent_repository(
-    supabase: Client = Depends(get_supabase_client),
+    supabase: AsyncClient = Depends(get_supabase_client),
 ) -> TalentRepository:
     """Dependency injection for Talent repository."""
     return TalentRepository(supabase)
 
 
 def get_exclusive_gear_repository(
-    supabase: Client = Depends(get_supabase_client),
+    supabase: AsyncClient = Depends(get_supabase_client),
 ) -> ExclusiveGearRepository:
     """Dependency injection for Exclusive Gear repository."""
     return ExclusiveGearRepository(supabase)
 
 
 def get_governor_gear_repository(
-    supabase: Client = Depends(get_supabase_client),
+    supabase: AsyncClient = Depends(get_supabase_client),
 ) -> GovernorGearRepository:
     """Dependency injection for Governor Gear repository."""
     return GovernorGearRepository(supabase)
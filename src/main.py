@@ -1,6 +1,15 @@
+import asyncio
+import logging
+from contextlib import asynccontextmanager, suppress
+from typing import Any, AsyncIterator
+
+import httpx
 from fastapi import FastAPI
 
-from src.db.supabase_client import get_supabase_client
+from src.cache import clear_caches, run_cache_refresher
+from src.db.repositories.governor_gear import GovernorGearRepository
+from src.db.repositories.hero import HeroRepository
+from src.db.supabase_client import get_async_supabase_client
 from src.routes import (
     exclusive_gear,
     governor_gear,
@@ -12,11 +21,83 @@ from src.routes import (
     vip,
 )
 
-db = get_supabase_client()
+logger = logging.getLogger(__name__)
+
+# Default pages of the cached catalog endpoints, requested in-process at startup
+_WARM_PATHS = (
+    "/heroes/",
+    "/skills/",
+    "/talents/",
+    "/exclusive-gear/",
+    "/stats/conquest",
+    "/stats/expedition",
+    "/troops/",
+    "/vip/",
+)
+_WARM_TIMEOUT_SECONDS = 10
+
+
+async def _warm_caches(app: FastAPI, client: Any) -> None:
+    """Populate the in-process caches so the first requests are cache hits.
+
+    Warming is best effort: failures are logged and the app starts anyway,
+    filling the caches on demand.
+    """
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://warmup") as http:
+        results = await asyncio.gather(
+            *(http.get(path) for path in _WARM_PATHS),
+            HeroRepository(client).warm_cache(),
+            governor_gear.get_calculator_index(GovernorGearRepository(client)),
+            return_exceptions=True,
+        )
+
+    for result in results:
+        if isinstance(result, BaseException):
+            logger.warning("Cache warming failed: %r", result)
+        elif isinstance(result, httpx.Response) and result.is_error:
+            logger.warning(
+                "Cache warming request %s returned %s",
+                result.request.url.path,
+                result.status_code,
+            )
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Open the shared Supabase client and warm caches at startup.
+
+    All requests reuse the client's keep-alive HTTP/2 connection pool, so it
+    is created once (failing fast on missing credentials) instead of lazily on
+    the first request. Caches are warmed before traffic is served and kept
+    fresh by a background task. When the app stops, the task is cancelled and
+    the caches are emptied, so no entry outlives the client it loads through.
+    """
+    client = get_async_supabase_client()
+    rest = client.postgrest
+    try:
+        await asyncio.wait_for(_warm_caches(app, client), _WARM_TIMEOUT_SECONDS)
+    except asyncio.TimeoutError:
+        logger.warning("Cache warming timed out; caches will fill on demand")
+    refresher = asyncio.create_task(run_cache_refresher())
+    try:
+        yield
+    finally:
+        refresher.cancel()
+        with suppress(asyncio.CancelledError):
+            await refresher
+        clear_caches()
+        await rest.aclose()
+        get_async_supabase_client.cache_clear()
+
+
+# Cached list routes return JSON bytes already serialized by pydantic-core
+# (src.cache.cached_json_response), so no ORJSONResponse default is needed.
 app = FastAPI(
     title="Kingshot Heroes API",
     description="An API for Kingshot hero data.",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 
@@ -6,24 +6,28 @@ Provides:
 
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 
+from src.cache import TTLCache, cached_json_response
 from src.db.repositories.exclusive_gear import ExclusiveGearRepository
+from src.db.utils import slugify
 from src.dependencies import get_exclusive_gear_repository
 from src.schemas.exclusive_gear import HeroExclusiveGearListResponse
 
 router = APIRouter(prefix="/exclusive-gear", tags=["exclusive-gear"])
 
+_list_cache = TTLCache(ttl=60)
+
 
 @router.get("/", response_model=HeroExclusiveGearListResponse)
-def list_exclusive_gear(
+async def list_exclusive_gear(
     hero: Optional[str] = Query(
         None, description="Filter by hero slug (e.g., 'jabel', 'olive')"
     ),
     limit: int = Query(25, ge=1, le=50, description="Maximum gear items to return"),
     offset: int = Query(0, ge=0, description="Number of gear items to skip"),
     gear_repo: ExclusiveGearRepository = Depends(get_exclusive_gear_repository),
-) -> HeroExclusiveGearListResponse:
+) -> Response:
     """List all exclusive gear with optional hero filter.
 
     Query parameters:
@@ -32,9 +36,15 @@ def list_exclusive_gear(
 
     Returns a paginated list of exclusive gear with levels and skills.
     """
-    gear, total = gear_repo.list_filtered(
-        hero_slug=hero,
-        limit=limit,
-        offset=offset,
+
+    async def build() -> HeroExclusiveGearListResponse:
+        gear, total = await gear_repo.list_filtered(
+            hero_slug=hero,
+            limit=limit,
+            offset=offset,
+        )
+        return HeroExclusiveGearListResponse(gear=gear, total=total)
+
+    return await cached_json_response(
+        _list_cache, (slugify(hero) if hero else None, limit, offset), build
     )
-    return HeroExclusiveGearListResponse(gear=gear, total=total)
@@ -10,10 +10,29 @@ Provides:
 - GET /governor-gear/charms/levels/{level} - Get specific charm level
 """
 
-from typing import Any, Dict, List, Optional
+import asyncio
+import logging
+import sys
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import (
+    Any,
+    AsyncIterator,
+    DefaultDict,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+)
 
 from fastapi import APIRouter, Depends, HTTPException, Path, Query, status
+from fastapi.responses import StreamingResponse
 
+from src.cache import TTLCache
 from src.db.repositories.governor_gear import GovernorGearRepository
 from src.dependencies import get_governor_gear_repository
 from src.schemas.enums import GearRarity, HeroClass
@@ -21,6 +40,7 @@ from src.schemas.governor_gear import (
     GearConfiguration,
     GearStatsBreakdown,
     GearStatsCalculation,
+    GearStatsTotals,
     GovernorGear,
     GovernorGearCharmLevel,
     GovernorGearCharmSlot,
@@ -28,8 +48,9 @@ from src.schemas.governor_gear import (
     GovernorGearWithCharms,
 )
 
-router = APIRouter(prefix="/governor-gear", tags=["governor-gear"])
+logger = logging.getLogger(__name__)
 
+router = APIRouter(prefix="/governor-gear", tags=["governor-gear"])
 
 # =============================================================================
 # Governor Gear Base Pieces
@@ -229,6 +250,149 @@ async def get_charm_level_by_id(
 # Governor Gear Calculator
 # =============================================================================
 
+# Gear level bonuses store troop stats unprefixed; the calculator reports them
+# with the "troop_" prefix used by charm bonuses (e.g. troop_attack_pct).
+_TROOP_PREFIX = "troop_"
+_TROOP_KEYS = frozenset({"attack_pct", "defense_pct", "health_pct"})
+_TROOP_PREFIXED = {key: sys.intern(f"{_TROOP_PREFIX}{key}") for key in _TROOP_KEYS}
+
+# Pre-classified bonus entry: (breakdown_key, troop_stat, value). ``troop_stat``
+# is the unprefixed stat for troop-specific bonuses and None for general ones.
+# Keys are interned while indexing so the per-request accumulator dicts hit
+# CPython's identity fast path instead of comparing string contents.
+IndexedBonus = Tuple[str, Optional[str], float]
+
+
+def _index_gear_bonuses(bonuses: Dict[str, Any]) -> Tuple[IndexedBonus, ...]:
+    """Classify gear level bonuses once so the calculator only sums values.
+
+    Args:
+        bonuses: Raw ``bonuses`` mapping from a governor gear level.
+
+    Returns:
+        Tuple of (breakdown_key, troop_stat, value) entries.
+    """
+    indexed: List[IndexedBonus] = []
+    for key, value in bonuses.items():
+        breakdown_key = _TROOP_PREFIXED.get(key) or sys.intern(key)
+        indexed.append((breakdown_key, _troop_stat(breakdown_key), value))
+    return tuple(indexed)
+
+
+def _index_gem_bonuses(
+    bonus_keys: List[str], bonuses: Dict[str, Any]
+) -> Tuple[IndexedBonus, ...]:
+    """Resolve the bonuses a charm level grants through a specific charm slot.
+
+    Only keys the slot provides and the level actually grants (value > 0) are
+    kept, so the calculator never has to skip zero or missing entries.
+
+    Args:
+        bonus_keys: Bonus keys provided by the charm slot.
+        bonuses: Raw ``bonuses`` mapping from a charm level.
+
+    Returns:
+        Tuple of (key, troop_stat, value) entries.
+    """
+    indexed: List[IndexedBonus] = []
+    for key in bonus_keys:
+        value = bonuses.get(key, 0.0)
+        if value > 0:
+            key = sys.intern(key)
+            indexed.append((key, _troop_stat(key), value))
+    return tuple(indexed)
+
+
+def _troop_stat(key: str) -> Optional[str]:
+    """Return the stat name without the troop prefix, or None for general keys."""
+    if key.startswith(_TROOP_PREFIX):
+        return sys.intern(key[len(_TROOP_PREFIX) :])
+    return None
+
+
+@dataclass(frozen=True, slots=True)
+class _CalculatorIndex:
+    """Read-only lookup tables used by the gear stat calculator."""
+
+    # gear_id -> GovernorGear
+    gear: Mapping[str, GovernorGear]
+    # (rarity, tier, stars) -> pre-classified gear level bonuses
+    levels: Mapping[Tuple[GearRarity, int, int], Tuple[IndexedBonus, ...]]
+    # (gear_id, slot_index) -> troop group of the charm slot
+    charm_slots: Mapping[Tuple[str, int], str]
+    # (gear_id, slot_index, charm level) -> non-zero gem bonuses for that slot
+    gem_bonuses: Mapping[Tuple[str, int, int], Tuple[IndexedBonus, ...]]
+
+
+# Reference tables only change when the seeding scripts run; the shared
+# refresher reloads the index ahead of expiry while the calculator is in use.
+_calculator_cache = TTLCache(ttl=300, maxsize=1)
+
+
+async def _build_calculator_index(repo: GovernorGearRepository) -> _CalculatorIndex:
+    """Fetch the governor gear reference tables and index them for lookups."""
+    started = time.perf_counter()
+    all_gear, levels, charm_levels, charm_slots = await asyncio.gather(
+        repo.get_all_gear(),
+        repo.get_all_levels(),
+        repo.get_all_charm_levels(),
+        repo.get_all_charm_slots(),
+    )
+    fetched = time.perf_counter()
+
+    index = _CalculatorIndex(
+        gear=MappingProxyType({g.gear_id: g for g in all_gear}),
+        levels=MappingProxyType(
+            {
+                (l.rarity, l.tier, l.stars): _index_gear_bonuses(l.bonuses)
+                for l in levels
+            }
+        ),
+        charm_slots=MappingProxyType(
+            {
+                (s.gear_id, s.slot_index): sys.intern(s.troop_type.value.lower())
+                for s in charm_slots
+            }
+        ),
+        gem_bonuses=MappingProxyType(
+            {
+                (s.gear_id, s.slot_index, l.level): _index_gem_bonuses(
+                    s.bonus_keys, l.bonuses
+                )
+                for s in charm_slots
+                for l in charm_levels
+            }
+        ),
+    )
+    logger.debug(
+        "Built calculator index: fetch_ms=%.2f index_build_ms=%.2f",
+        (fetched - started) * 1000,
+        (time.perf_counter() - fetched) * 1000,
+    )
+    return index
+
+
+async def get_calculator_index(repo: GovernorGearRepository) -> _CalculatorIndex:
+    """Return the cached calculator lookup tables, building them when expired.
+
+    Concurrent requests share a single build, and the previous index keeps
+    being served if a rebuild fails.
+
+    Args:
+        repo: Repository used to load the reference tables when not cached.
+
+    Returns:
+        The shared, read-only calculator index.
+    """
+    return await _calculator_cache.get_or_load(
+        "index", lambda: _build_calculator_index(repo)
+    )
+
+
+def reset_calculator_index() -> None:
+    """Drop the cached calculator index so the next request reloads it."""
+    _calculator_cache.clear()
+
 
 @router.post("/calculate-stats", response_model=GearStatsCalculation)
 async def calculate_gear_stats(
@@ -243,66 +407,127 @@ async def calculate_gear_stats(
     Returns:
         Total calculated stats and breakdown
     """
-    # Fetch all necessary data
-    # Note: In a production environment, these should be cached
-    all_gear = await repo.get_all_gear()
-    levels = await repo.get_all_levels()
-    charm_levels = await repo.get_all_charm_levels()
-    charm_slots = await repo.get_all_charm_slots()
-
-    # Create lookup maps
-    # gear_id -> GovernorGear
-    gear_map = {g.gear_id: g for g in all_gear}
+    # Nothing to calculate; avoid touching the reference tables at all
+    if not config:
+        return GearStatsCalculation.model_construct(total_bonuses={}, breakdown=[])
+
+    # Phase timings show whether a request was spent waiting on the reference
+    # tables or summing bonuses, which decides where optimization pays off.
+    started = time.perf_counter()
+    index = await get_calculator_index(repo)
+    indexed = time.perf_counter()
+    result = _aggregate_gear_stats(config, index)
+    logger.debug(
+        "Calculated gear stats for %d items: index_ms=%.2f compute_ms=%.2f",
+        len(config),
+        (indexed - started) * 1000,
+        (time.perf_counter() - indexed) * 1000,
+    )
+    return result
 
-    # (rarity, tier, stars) -> GovernorGearLevel
-    levels_map = {(l.rarity, l.tier, l.stars): l for l in levels}
 
-    # level -> GovernorGearCharmLevel
-    charm_levels_map = {l.level: l for l in charm_levels}
+@router.post("/calculate-stats/stream")
+async def stream_gear_stats(
+    config: List[GearConfiguration],
+    repo: GovernorGearRepository = Depends(get_governor_gear_repository),
+) -> StreamingResponse:
+    """Calculate stats for a gear configuration as newline-delimited JSON.
 
-    # (gear_id, slot_index) -> GovernorGearCharmSlot
-    charm_slots_map = {(s.gear_id, s.slot_index): s for s in charm_slots}
+    Emits one ``GearStatsBreakdown`` line per gear piece as it is computed,
+    followed by a final ``GearStatsTotals`` line, so large configurations are
+    never held in memory as a complete response.
 
-    total_bonuses: Dict[str, Dict[str, float]] = {}
-    breakdown: List[GearStatsBreakdown] = []
+    Args:
+        config: List of gear configurations (gear piece, rarity, stars, gems)
 
-    def add_to_total(key: str, val: float, t_type: Optional[HeroClass]) -> None:
-        """Helper to aggregate bonuses into nested structure."""
-        if key.startswith("troop_") and t_type:
-            group = t_type.value.lower()
-            stat = key.replace("troop_", "", 1)
-        else:
-            group = "general"
-            stat = key
+    Returns:
+        NDJSON stream of per-piece breakdowns and the aggregated totals
+    """
+    index = await get_calculator_index(repo) if config else None
 
-        if group not in total_bonuses:
-            total_bonuses[group] = {}
-        total_bonuses[group][stat] = total_bonuses[group].get(stat, 0.0) + val
+    async def lines() -> AsyncIterator[bytes]:
+        total_bonuses: DefaultDict[str, DefaultDict[str, float]] = defaultdict(
+            lambda: defaultdict(float)
+        )
+        if index is not None:
+            for entry in _iter_gear_breakdowns(config, index, total_bonuses):
+                yield entry.model_dump_json().encode() + b"\n"
+        totals = GearStatsTotals.model_construct(
+            total_bonuses={group: dict(stats) for group, stats in total_bonuses.items()}
+        )
+        yield totals.model_dump_json().encode() + b"\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
+def _aggregate_gear_stats(
+    config: List[GearConfiguration], index: _CalculatorIndex
+) -> GearStatsCalculation:
+    """Sum gear and gem bonuses for a configuration against the lookup tables.
+
+    Pure CPU work with no I/O, kept separate from the endpoint so it can be
+    exercised and timed on its own.
+
+    Args:
+        config: List of gear configurations (gear piece, rarity, stars, gems)
+        index: Cached calculator lookup tables
+
+    Returns:
+        Total calculated stats and breakdown
+    """
+    # A request covers at most six gear pieces with a handful of bonus keys
+    # each, so sparse dict accumulation is cheaper than array-based summation
+    # (and keeps float64 precision in the reported totals).
+    total_bonuses: DefaultDict[str, DefaultDict[str, float]] = defaultdict(
+        lambda: defaultdict(float)
+    )
+    breakdown = list(_iter_gear_breakdowns(config, index, total_bonuses))
+
+    return GearStatsCalculation.model_construct(
+        total_bonuses={group: dict(stats) for group, stats in total_bonuses.items()},
+        breakdown=breakdown,
+    )
+
+
+def _iter_gear_breakdowns(
+    config: List[GearConfiguration],
+    index: _CalculatorIndex,
+    total_bonuses: DefaultDict[str, DefaultDict[str, float]],
+) -> Iterator[GearStatsBreakdown]:
+    """Yield the breakdown for each gear piece, accumulating into the totals.
+
+    Args:
+        config: List of gear configurations (gear piece, rarity, stars, gems)
+        index: Cached calculator lookup tables
+        total_bonuses: Running totals grouped by troop type, updated in place
+
+    Yields:
+        Breakdown of gear and gem bonuses for each configured piece
+    """
+    gear_map = index.gear
+    levels_map = index.levels
+    charm_slots_map = index.charm_slots
+    gem_bonuses_map = index.gem_bonuses
 
     for item in config:
-        current_gear_bonuses: Dict[str, float] = {}
-        current_gem_bonuses: Dict[str, float] = {}
+        current_gear_bonuses: DefaultDict[str, float] = defaultdict(float)
+        current_gem_bonuses: DefaultDict[str, float] = defaultdict(float)
         errors: List[str] = []
 
         # 1. Calculate Gear Bonuses
-        gear_level = levels_map.get((item.rarity, item.tier, item.stars))
+        gear_bonuses = levels_map.get((item.rarity, item.tier, item.stars))
         gear_info = gear_map.get(item.gear_id)
 
-        if gear_level and gear_info:
-            for key, value in gear_level.bonuses.items():
-                # Normalize key for breakdown (e.g. attack_pct -> troop_attack_pct)
-                breakdown_key = key
-                if key in ["attack_pct", "defense_pct", "health_pct"]:
-                    breakdown_key = f"troop_{key}"
-
-                current_gear_bonuses[breakdown_key] = (
-                    current_gear_bonuses.get(breakdown_key, 0.0) + value
-                )
-
-                # Add to total bonuses
-                add_to_total(breakdown_key, value, gear_info.troop_type)
+        if gear_bonuses is not None and gear_info:
+            troop_group = gear_info.troop_type.value.lower()
+            for breakdown_key, troop_stat, value in gear_bonuses:
+                current_gear_bonuses[breakdown_key] += value
+                if troop_stat is not None:
+                    total_bonuses[troop_group][troop_stat] += value
+                else:
+                    total_bonuses["general"][breakdown_key] += value
         else:
-            if not gear_level:
+            if gear_bonuses is None:
                 errors.append(
                     f"Level not found for {item.rarity} T{item.tier} {item.stars}*"
                 )
@@ -314,37 +539,30 @@ async def calculate_gear_stats(
             slot_index = i + 1  # 1-based index
 
             # Get slot definition
-            slot = charm_slots_map.get((item.gear_id, slot_index))
-            if not slot:
+            troop_group = charm_slots_map.get((item.gear_id, slot_index))
+            if troop_group is None:
                 errors.append(f"Slot {slot_index} not found for {item.gear_id}")
                 continue
 
-            # Get gem level data
-            gem_data = charm_levels_map.get(gem_level_val)
-            if not gem_data:
+            # Get the bonuses this gem level grants through the slot
+            gem_bonuses = gem_bonuses_map.get((item.gear_id, slot_index, gem_level_val))
+            if gem_bonuses is None:
                 errors.append(f"Gem level {gem_level_val} not found")
                 continue
 
-            # Apply bonuses based on slot keys
-            for key in slot.bonus_keys:
-                # We assume the gem data has the value for this key
-                # If not, we might need a fallback or it's 0
-                value = gem_data.bonuses.get(key, 0.0)
-                if value > 0:
-                    # Keep generic key for breakdown (e.g. troop_lethality_pct)
-                    current_gem_bonuses[key] = current_gem_bonuses.get(key, 0.0) + value
-
-                    # Add to total bonuses
-                    add_to_total(key, value, slot.troop_type)
-
-        breakdown.append(
-            GearStatsBreakdown(
-                gear_id=item.gear_id,
-                troop_type=gear_info.troop_type if gear_info else None,
-                gear_bonus=current_gear_bonuses,
-                gem_bonus=current_gem_bonuses,
-                errors=errors,
-            )
+            for key, troop_stat, value in gem_bonuses:
+                # Keep generic key for breakdown (e.g. troop_lethality_pct)
+                current_gem_bonuses[key] += value
+                if troop_stat is not None:
+                    total_bonuses[troop_group][troop_stat] += value
+                else:
+                    total_bonuses["general"][key] += value
+
+        # Values are built internally from validated data; skip re-validation
+        yield GearStatsBreakdown.model_construct(
+            gear_id=item.gear_id,
+            troop_type=gear_info.troop_type if gear_info else None,
+            gear_bonus=dict(current_gear_bonuses),
+            gem_bonus=dict(current_gem_bonuses),
+            errors=errors,
         )
-
-    return GearStatsCalculation(total_bonuses=total_bonuses, breakdown=breakdown)
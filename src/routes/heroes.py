@@ -5,11 +5,12 @@ exclusive gear) so clients such as the simulator, wiki tools, or dashboards can
 fetch everything from a single namespace.
 """
 
-from typing import Any, Dict, List, Optional
+import asyncio
+from typing import Any, Awaitable, Dict, List, Optional, Tuple
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from fastapi.concurrency import run_in_threadpool
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 
+from src.cache import TTLCache, cached_json_response
 from src.db.repositories.exclusive_gear import ExclusiveGearRepository
 from src.db.repositories.hero import HeroRepository
 from src.db.repositories.skills import SkillsRepository
@@ -31,7 +32,7 @@ from src.schemas.exclusive_gear import (
     HeroExclusiveGearProgressionResponse,
     HeroExclusiveGearResponse,
 )
-from src.schemas.hero import HeroBasicResponse, HeroListResponse
+from src.schemas.hero import HeroBasicResponse, HeroDetailResponse, HeroListResponse
 from src.schemas.skills import HeroSkillResponse
 from src.schemas.stats import (
     ConquestStatsResponse,
@@ -42,9 +43,11 @@ from src.schemas.talent import HeroTalentResponse
 
 router = APIRouter(prefix="/heroes", tags=["heroes"])
 
+_list_cache = TTLCache(ttl=60)
+
 
 @router.get("/", response_model=HeroListResponse)
-def list_heroes(
+async def list_heroes(
     generation: Optional[HeroGeneration] = Query(
         None, description="Filter by generation (1, 2, or 3)"
     ),
@@ -66,7 +69,7 @@ def list_heroes(
         description="Number of heroes to skip before collecting results",
     ),
     hero_repo: HeroRepository = Depends(get_hero_repository),
-) -> HeroListResponse:
+) -> Response:
     """List all heroes with optional filters.
 
     Query parameters:
@@ -78,19 +81,27 @@ def list_heroes(
 
     Returns a list of heroes matching the filters.
     """
-    heroes, total = hero_repo.list_filtered(
-        generation=generation.value if generation else None,
-        rarity=rarity.value if rarity else None,
-        hero_class=hero_class.value if hero_class else None,
-        limit=limit,
-        offset=offset,
+    filters = (
+        generation.value if generation else None,
+        rarity.value if rarity else None,
+        hero_class.value if hero_class else None,
     )
 
-    return HeroListResponse(heroes=heroes, total=total)
+    async def build() -> HeroListResponse:
+        heroes, total = await hero_repo.list_filtered(
+            generation=filters[0],
+            rarity=filters[1],
+            hero_class=filters[2],
+            limit=limit,
+            offset=offset,
+        )
+        return HeroListResponse(heroes=heroes, total=total)
+
+    return await cached_json_response(_list_cache, (*filters, limit, offset), build)
 
 
 @router.get("/{hero_slug}", response_model=HeroBasicResponse)
-def get_hero(
+async def get_hero(
     hero_slug: str,
     hero_repo: HeroRepository = Depends(get_hero_repository),
 ) -> HeroBasicResponse:
@@ -105,7 +116,7 @@ def get_hero(
     Raises:
         404: If hero not found
     """
-    hero = hero_repo.get_by_slug(hero_slug)
+    hero = await hero_repo.get_by_slug(hero_slug)
 
     if not hero:
         raise HTTPException(status_code=404, detail=f"Hero '{hero_slug}' not found")
@@ -114,12 +125,33 @@ def get_hero(
 
 
 async def _hero_or_404(hero_slug: str, hero_repo: HeroRepository) -> HeroBasicResponse:
-    hero = await run_in_threadpool(hero_repo.get_by_slug, hero_slug)
+    hero = await hero_repo.get_by_slug(hero_slug)
     if hero is None:
         raise HTTPException(status_code=404, detail=f"Hero '{hero_slug}' not found")
     return hero
 
 
+async def _with_hero(
+    hero_slug: str, hero_repo: HeroRepository, *queries: Awaitable[Any]
+) -> Tuple[Any, ...]:
+    """Run ``queries`` while checking the hero exists, returning both.
+
+    The queries start before the hero lookup so they overlap with it. If
+    the lookup raises its 404, or any query fails, the remaining queries are
+    cancelled and awaited so none keeps running after the request ends.
+    """
+    tasks = [asyncio.ensure_future(query) for query in queries]
+    try:
+        hero = await _hero_or_404(hero_slug, hero_repo)
+        results = await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+    return (hero, *results)
+
+
 @router.get(
     "/{hero_slug}/skills",
     response_model=List[HeroSkillResponse],
@@ -130,8 +162,11 @@ async def get_hero_skills(
     hero_repo: HeroRepository = Depends(get_hero_repository),
     skills_repo: SkillsRepository = Depends(get_skills_repository),
 ) -> List[HeroSkillResponse]:
-    hero = await _hero_or_404(hero_slug, hero_repo)
-    skills = await run_in_threadpool(skills_repo.list_by_hero, str(hero.id))
+    _, skills = await _with_hero(
+        hero_slug,
+        hero_repo,
+        skills_repo.list_by_hero_slug(hero_slug),
+    )
     return skills
 
 
@@ -145,8 +180,11 @@ async def get_hero_exclusive_gear(
     hero_repo: HeroRepository = Depends(get_hero_repository),
     gear_repo: ExclusiveGearRepository = Depends(get_exclusive_gear_repository),
 ) -> List[HeroExclusiveGearResponse]:
-    await _hero_or_404(hero_slug, hero_repo)
-    gear = await run_in_threadpool(gear_repo.list_by_hero_slug, hero_slug)
+    _, gear = await _with_hero(
+        hero_slug,
+        hero_repo,
+        gear_repo.list_by_hero_slug(hero_slug),
+    )
     return gear
 
 
@@ -160,8 +198,11 @@ async def get_hero_talents(
     hero_repo: HeroRepository = Depends(get_hero_repository),
     talent_repo: TalentRepository = Depends(get_talent_repository),
 ) -> List[HeroTalentResponse]:
-    await _hero_or_404(hero_slug, hero_repo)
-    talents = await run_in_threadpool(talent_repo.list_by_hero_slug, hero_slug)
+    _, talents = await _with_hero(
+        hero_slug,
+        hero_repo,
+        talent_repo.list_by_hero_slug(hero_slug),
+    )
     return talents
 
 
@@ -175,8 +216,10 @@ async def get_hero_exclusive_gear_progression(
     hero_repo: HeroRepository = Depends(get_hero_repository),
     gear_repo: ExclusiveGearRepository = Depends(get_exclusive_gear_repository),
 ) -> HeroExclusiveGearProgressionResponse:
+    # get_progression raises on zero rows (.single()), so an unknown slug
+    # must be rejected with a 404 before the progression query runs.
     await _hero_or_404(hero_slug, hero_repo)
-    progression = await run_in_threadpool(gear_repo.get_progression, hero_slug)
+    progression = await gear_repo.get_progression(hero_slug)
     if not progression:
         raise HTTPException(
             status_code=404,
@@ -198,9 +241,13 @@ async def get_hero_stats(
         get_expedition_stats_repository
     ),
 ) -> HeroStatsBundleResponse:
-    hero = await _hero_or_404(hero_slug, hero_repo)
-    conquest = await run_in_threadpool(conquest_repo.list_by_hero_slug, hero_slug)
-    expedition = await run_in_threadpool(expedition_repo.list_by_hero_slug, hero_slug)
+    # Hero lookup and both stat queries are independent, so run them together.
+    hero, conquest, expedition = await _with_hero(
+        hero_slug,
+        hero_repo,
+        conquest_repo.list_by_hero_slug(hero_slug),
+        expedition_repo.list_by_hero_slug(hero_slug),
+    )
     return HeroStatsBundleResponse(
         hero_id=hero.id,
         hero_slug=hero.hero_id_slug,
@@ -220,8 +267,11 @@ async def get_hero_conquest_stats(
     hero_repo: HeroRepository = Depends(get_hero_repository),
     conquest_repo: HeroConquestStatsRepository = Depends(get_conquest_stats_repository),
 ) -> List[ConquestStatsResponse]:
-    await _hero_or_404(hero_slug, hero_repo)
-    stats = await run_in_threadpool(conquest_repo.list_by_hero_slug, hero_slug)
+    _, stats = await _with_hero(
+        hero_slug,
+        hero_repo,
+        conquest_repo.list_by_hero_slug(hero_slug),
+    )
     return stats
 
 
@@ -237,6 +287,62 @@ async def get_hero_expedition_stats(
         get_expedition_stats_repository
     ),
 ) -> List[ExpeditionStatsResponse]:
-    await _hero_or_404(hero_slug, hero_repo)
-    stats = await run_in_threadpool(expedition_repo.list_by_hero_slug, hero_slug)
+    _, stats = await _with_hero(
+        hero_slug,
+        hero_repo,
+        expedition_repo.list_by_hero_slug(hero_slug),
+    )
     return stats
+
+
+@router.get(
+    "/{hero_slug}/bundle",
+    response_model=HeroDetailResponse,
+    summary="Get a hero with all nested data in one request",
+)
+async def get_hero_bundle(
+    hero_slug: str,
+    hero_repo: HeroRepository = Depends(get_hero_repository),
+    skills_repo: SkillsRepository = Depends(get_skills_repository),
+    gear_repo: ExclusiveGearRepository = Depends(get_exclusive_gear_repository),
+    talent_repo: TalentRepository = Depends(get_talent_repository),
+    conquest_repo: HeroConquestStatsRepository = Depends(get_conquest_stats_repository),
+    expedition_repo: HeroExpeditionStatsRepository = Depends(
+        get_expedition_stats_repository
+    ),
+) -> HeroDetailResponse:
+    """Get a hero together with its stats, skills, exclusive gear and talents.
+
+    Replaces the per-resource requests a hero page would otherwise make; all
+    lookups run concurrently.
+
+    Args:
+        hero_slug: The hero's unique identifier (e.g., 'jabel', 'olive')
+
+    Returns:
+        Hero details with all nested data
+
+    Raises:
+        404: If hero not found
+    """
+    hero, skills, gear, talents, conquest, expedition = await _with_hero(
+        hero_slug,
+        hero_repo,
+        skills_repo.list_by_hero_slug(hero_slug),
+        gear_repo.list_by_hero_slug(hero_slug),
+        talent_repo.list_by_hero_slug(hero_slug),
+        conquest_repo.list_by_hero_slug(hero_slug),
+        expedition_repo.list_by_hero_slug(hero_slug),
+    )
+    # Copy only declared fields: dict(hero) would also carry the cached
+    # image_url, and model_dump() would drop the excluded image_path.
+    fields = {name: getattr(hero, name) for name in HeroBasicResponse.model_fields}
+    return HeroDetailResponse(
+        **fields,
+        conquest_stats=conquest,
+        expedition_stats=expedition,
+        conquest_skills=[s for s in skills if s.battle_type == "Conquest"],
+        expedition_skills=[s for s in skills if s.battle_type == "Expedition"],
+        exclusive_gear=gear[0] if gear else None,
+        talents=talents,
+    )
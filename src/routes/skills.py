@@ -6,18 +6,25 @@ Provides:
 
 from typing import Optional
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Response
 
+from src.cache import TTLCache, cached_json_response
 from src.db.repositories.skills import SkillsRepository
+from src.db.utils import slugify
 from src.dependencies import get_skills_repository
 from src.schemas.enums import GameMode, SkillLevel, SkillType
 from src.schemas.skills import HeroSkillListResponse, HeroSkillResponse
 
 router = APIRouter(prefix="/skills", tags=["skills"])
 
+_list_cache = TTLCache(ttl=60)
+
+# Query parameters use lowercase modes; the battle_type column is capitalized
+_BATTLE_TYPES = {mode: mode.value.capitalize() for mode in GameMode}
+
 
 @router.get("/", response_model=HeroSkillListResponse)
-def list_skills(
+async def list_skills(
     hero: Optional[str] = Query(
         None, description="Filter by hero slug (e.g., 'jabel', 'olive')"
     ),
@@ -35,7 +42,7 @@ def list_skills(
     ),
     offset: int = Query(0, ge=0, description="Number of skills to skip"),
     skills_repo: SkillsRepository = Depends(get_skills_repository),
-) -> HeroSkillListResponse:
+) -> Response:
     """List all skills with optional filters.
 
     Query parameters:
@@ -47,24 +54,20 @@ def list_skills(
 
     Returns a paginated list of skills matching the filters.
     """
-    battle_type = mode.value.capitalize() if mode else None
-    skills, total = skills_repo.list_filtered(
-        hero_slug=hero,
-        skill_type=skill_type.value if skill_type else None,
-        battle_type=battle_type,
-        limit=limit,
-        offset=offset,
-    )
 
-    # Filter by level - this filters the levels array within each skill
-    if level is not None:
-        filtered_skills = []
-        for skill in skills:
-            levels = skill.levels or []
-            skill.levels = [lv for lv in levels if lv.level == level.value]
-            if skill.levels:
-                filtered_skills.append(skill)
-        skills = filtered_skills
-        total = len(skills)
+    async def build() -> HeroSkillListResponse:
+        skills, total = await skills_repo.list_filtered(
+            hero_slug=hero,
+            skill_type=skill_type.value if skill_type else None,
+            battle_type=_BATTLE_TYPES.get(mode),
+            level=level.value if level is not None else None,
+            limit=limit,
+            offset=offset,
+        )
+        return HeroSkillListResponse(skills=skills, total=total)
 
-    return HeroSkillListResponse(skills=skills, total=total)
+    return await cached_json_response(
+        _list_cache,
+        (slugify(hero) if hero else None, level, skill_type, mode, limit, offset),
+        build,
+    )
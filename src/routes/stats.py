@@ -7,12 +7,14 @@ Provides:
 
 from typing import Optional
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Response
 
+from src.cache import TTLCache, cached_json_response
 from src.db.repositories.stats import (
     HeroConquestStatsRepository,
     HeroExpeditionStatsRepository,
 )
+from src.db.utils import slugify
 from src.dependencies import (
     get_conquest_stats_repository,
     get_expedition_stats_repository,
@@ -21,9 +23,12 @@ from src.schemas.stats import HeroExpeditionStatsListResponse, HeroStatsListResp
 
 router = APIRouter(prefix="/stats", tags=["stats"])
 
+# Stats are tuned more often than the other catalogs, so keep them fresher
+_list_cache = TTLCache(ttl=10)
+
 
 @router.get("/conquest", response_model=HeroStatsListResponse)
-def list_conquest_stats(
+async def list_conquest_stats(
     hero: Optional[str] = Query(
         None, description="Filter by hero ID (e.g., 'jabel', 'olive')"
     ),
@@ -32,7 +37,7 @@ def list_conquest_stats(
     ),
     offset: int = Query(0, ge=0, description="Number of conquest stat rows to skip"),
     conquest_repo: HeroConquestStatsRepository = Depends(get_conquest_stats_repository),
-) -> HeroStatsListResponse:
+) -> Response:
     """List all hero conquest stats.
 
     Query parameters:
@@ -42,16 +47,22 @@ def list_conquest_stats(
     Returns a list of conquest stats (attack, defense, health).
     Note: Conquest stats have no level progression in the current data.
     """
-    stats, total = conquest_repo.list_filtered(
-        hero_slug=hero,
-        limit=limit,
-        offset=offset,
+
+    async def build() -> HeroStatsListResponse:
+        stats, total = await conquest_repo.list_filtered(
+            hero_slug=hero,
+            limit=limit,
+            offset=offset,
+        )
+        return HeroStatsListResponse(stats=stats, total=total)
+
+    return await cached_json_response(
+        _list_cache, ("conquest", slugify(hero) if hero else None, limit, offset), build
     )
-    return HeroStatsListResponse(stats=stats, total=total)
 
 
 @router.get("/expedition", response_model=HeroExpeditionStatsListResponse)
-def list_expedition_stats(
+async def list_expedition_stats(
     hero: Optional[str] = Query(
         None, description="Filter by hero ID (e.g., 'jabel', 'olive')"
     ),
@@ -62,7 +73,7 @@ def list_expedition_stats(
     expedition_repo: HeroExpeditionStatsRepository = Depends(
         get_expedition_stats_repository
     ),
-) -> HeroExpeditionStatsListResponse:
+) -> Response:
     """List all hero expedition stats.
 
     Query parameters:
@@ -72,9 +83,17 @@ def list_expedition_stats(
     Returns a list of expedition stats (percentage bonuses by troop type).
     Each hero typically has three entries (Infantry, Cavalry, Archer bonuses).
     """
-    stats, total = expedition_repo.list_filtered(
-        hero_slug=hero,
-        limit=limit,
-        offset=offset,
+
+    async def build() -> HeroExpeditionStatsListResponse:
+        stats, total = await expedition_repo.list_filtered(
+            hero_slug=hero,
+            limit=limit,
+            offset=offset,
+        )
+        return HeroExpeditionStatsListResponse(stats=stats, total=total)
+
+    return await cached_json_response(
+        _list_cache,
+        ("expedition", slugify(hero) if hero else None, limit, offset),
+        build,
     )
-    return HeroExpeditionStatsListResponse(stats=stats, total=total)
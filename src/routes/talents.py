@@ -6,17 +6,21 @@ Provides:
 
 from typing import Optional
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Response
 
+from src.cache import TTLCache, cached_json_response
 from src.db.repositories.talent import TalentRepository
+from src.db.utils import slugify
 from src.dependencies import get_talent_repository
 from src.schemas.talent import HeroTalentListResponse
 
 router = APIRouter(prefix="/talents", tags=["talents"])
 
+_list_cache = TTLCache(ttl=60)
+
 
 @router.get("/", response_model=HeroTalentListResponse)
-def list_talents(
+async def list_talents(
     hero: Optional[str] = Query(
         None, description="Filter by hero slug (e.g., 'jabel', 'olive')"
     ),
@@ -25,7 +29,7 @@ def list_talents(
     ),
     offset: int = Query(0, ge=0, description="Number of talents to skip"),
     talent_repo: TalentRepository = Depends(get_talent_repository),
-) -> HeroTalentListResponse:
+) -> Response:
     """List all hero talents with optional hero filter.
 
     Query parameters:
@@ -34,9 +38,15 @@ def list_talents(
 
     Returns a paginated list of talents.
     """
-    talents, total = talent_repo.list_filtered(
-        hero_slug=hero,
-        limit=limit,
-        offset=offset,
+
+    async def build() -> HeroTalentListResponse:
+        talents, total = await talent_repo.list_filtered(
+            hero_slug=hero,
+            limit=limit,
+            offset=offset,
+        )
+        return HeroTalentListResponse(talents=talents, total=total)
+
+    return await cached_json_response(
+        _list_cache, (slugify(hero) if hero else None, limit, offset), build
     )
-    return HeroTalentListResponse(talents=talents, total=total)
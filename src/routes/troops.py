@@ -7,8 +7,10 @@ Provides:
 
 from typing import List, Optional, Union
 
-from fastapi import APIRouter, Depends, HTTPException, Path, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Path, Query, Response, status
+from pydantic import TypeAdapter
 
+from src.cache import TTLCache, cached_json_response
 from src.db.repositories.troops import TroopsRepository
 from src.dependencies import get_troops_repository
 from src.schemas.troops import (
@@ -21,9 +23,14 @@ from src.schemas.troops import (
 
 router = APIRouter(prefix="/troops", tags=["troops"])
 
+# Troop stats are static game configuration, so they can be cached longer
+# than the other catalog lists.
+_troops_cache = TTLCache(ttl=300)
+_TROOP_LIST = TypeAdapter(List[Troop])
+
 
 @router.get("/", response_model=Union[TroopsGroupedByType, List[Troop]])
-def get_all_troops(
+async def get_all_troops(
     type: Optional[TroopType] = Query(None, description="Filter by troop type"),
     level: Optional[int] = Query(None, ge=1, le=11, description="Exact troop level"),
     min_level: Optional[int] = Query(
@@ -43,7 +50,7 @@ def get_all_troops(
         None, description="Group by 'type' (default) or 'none' for flat list"
     ),
     repo: TroopsRepository = Depends(get_troops_repository),
-) -> Union[TroopsGroupedByType, List[Troop]]:
+) -> Response:
     """Get troops with flexible filtering.
 
     Provides complete troop stat data for consumption by external tools.
@@ -68,84 +75,88 @@ def get_all_troops(
     Returns:
         Grouped dict or flat list of troop configurations matching filters
     """
-    # Handle exact match vs range queries
-    final_min_level = (
-        level if level is not None else (min_level if min_level is not None else 1)
-    )
-    final_max_level = (
-        level if level is not None else (max_level if max_level is not None else 10)
-    )
-    final_min_tg = tg if tg is not None else (min_tg if min_tg is not None else 0)
-    final_max_tg = tg if tg is not None else (max_tg if max_tg is not None else 5)
-
-    troops = repo.get_all(
-        troop_type=type,
-        min_level=final_min_level,
-        max_level=final_max_level,
-        min_tg=final_min_tg,
-        max_tg=final_max_tg,
-    )
+    # Handle exact match vs range queries. Levels start at 1, so ``or`` is a
+    # safe default there; TG 0 is a real tier and needs explicit None checks.
+    if level is not None:
+        final_min_level = final_max_level = level
+    else:
+        final_min_level, final_max_level = min_level or 1, max_level or 10
+    if tg is not None:
+        final_min_tg = final_max_tg = tg
+    else:
+        final_min_tg = 0 if min_tg is None else min_tg
+        final_max_tg = 5 if max_tg is None else max_tg
 
     # Return flat list if explicitly requested OR if filtering by specific type
     # (no point grouping when there's only one type)
-    if (group_by is not None and group_by == GroupBy.none) or type is not None:
-        return troops
-
-    # Group by type (default behavior when querying all types)
-    grouped: TroopsGroupedByType = TroopsGroupedByType()
-
-    for troop in troops:
-        troop_stats = TroopStats(
-            troop_type=troop.troop_type,
-            troop_level=troop.troop_level,
-            true_gold_level=troop.true_gold_level,
-            stats={
-                "attack": troop.attack,
-                "defense": troop.defense,
-                "health": troop.health,
-                "lethality": troop.lethality,
-                "power": troop.power,
-                "load": troop.load,
-                "speed": troop.speed,
-            },
-            training=(
-                {
-                    "training_time_seconds": troop.training_time_seconds,
-                    "training_power": troop.training_power,
-                }
-                if troop.training_time_seconds is not None
-                and troop.training_power is not None
-                else None
-            ),
-            costs=(
-                troop.training_costs
-                if troop.training_costs and len(troop.training_costs) > 0
-                else None
-            ),
-            events=(
-                troop.event_points
-                if troop.event_points and len(troop.event_points) > 0
-                else None
-            ),
+    flat = (group_by is not None and group_by == GroupBy.none) or type is not None
+    key = (type, final_min_level, final_max_level, final_min_tg, final_max_tg, flat)
+
+    async def build() -> Union[TroopsGroupedByType, List[Troop]]:
+        troops = await repo.get_all(
+            troop_type=type,
+            min_level=final_min_level,
+            max_level=final_max_level,
+            min_tg=final_min_tg,
+            max_tg=final_max_tg,
         )
 
-        if troop.troop_type == TroopType.infantry:
-            grouped.Infantry.append(troop_stats)
-        elif troop.troop_type == TroopType.cavalry:
-            grouped.Cavalry.append(troop_stats)
-        elif troop.troop_type == TroopType.archer:
-            grouped.Archer.append(troop_stats)
+        if flat:
+            return troops
 
-    return grouped
+        # Group by type (default behavior when querying all types). Rows were
+        # already validated by the repository, so skip re-validating them here.
+        grouped = TroopsGroupedByType.model_construct(
+            Infantry=[], Cavalry=[], Archer=[]
+        )
+        appenders = {
+            TroopType.infantry: grouped.Infantry.append,
+            TroopType.cavalry: grouped.Cavalry.append,
+            TroopType.archer: grouped.Archer.append,
+        }
+
+        for troop in troops:
+            troop_stats = TroopStats.model_construct(
+                troop_type=troop.troop_type,
+                troop_level=troop.troop_level,
+                true_gold_level=troop.true_gold_level,
+                stats={
+                    "attack": troop.attack,
+                    "defense": troop.defense,
+                    "health": troop.health,
+                    "lethality": troop.lethality,
+                    "power": troop.power,
+                    "load": troop.load,
+                    "speed": troop.speed,
+                },
+                training=(
+                    {
+                        "training_time_seconds": troop.training_time_seconds,
+                        "training_power": troop.training_power,
+                    }
+                    if troop.training_time_seconds is not None
+                    and troop.training_power is not None
+                    else None
+                ),
+                costs=troop.training_costs or None,
+                events=troop.event_points or None,
+            )
+
+            appenders[troop.troop_type](troop_stats)
+
+        return grouped
+
+    adapter = _TROOP_LIST if flat else None
+    return await cached_json_response(_troops_cache, key, build, adapter)
 
 
 @router.get("/{troop_type}/{troop_level}", response_model=Troop)
-def get_troop_by_configuration(
+async def get_troop_by_configuration(
     troop_type: TroopType = Path(..., description="Troop type"),
     troop_level: int = Path(..., ge=1, le=11, description="Troop level"),
     true_gold_level: int = Query(0, ge=0, le=10, description="True Gold level"),
     repo: TroopsRepository = Depends(get_troops_repository),
-) -> Troop:
+) -> Response:
     """Get specific troop configuration data.
 
     Args:
@@ -159,16 +170,21 @@ def get_troop_by_configuration(
     Raises:
         HTTPException: 404 if configuration not found
     """
-    troop = repo.get_by_configuration(
-        troop_type=troop_type,
-        troop_level=troop_level,
-        true_gold_level=true_gold_level,
-    )
-
-    if not troop:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"{troop_type.value} level {troop_level} TG{true_gold_level} not found",
+
+    async def build() -> Troop:
+        troop = await repo.get_by_configuration(
+            troop_type=troop_type,
+            troop_level=troop_level,
+            true_gold_level=true_gold_level,
         )
 
-    return troop
+        if not troop:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"{troop_type.value} level {troop_level} TG{true_gold_level} not found",
+            )
+
+        return troop
+
+    key = (troop_type, troop_level, true_gold_level)
+    return await cached_json_response(_troops_cache, key, build)
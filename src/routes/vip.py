@@ -7,21 +7,37 @@ Provides:
 
 from typing import List
 
-from fastapi import APIRouter, Depends, HTTPException, Path, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Path, Query, Response, status
+from pydantic import TypeAdapter
 
+from src.cache import TTLCache
 from src.db.repositories.vip import VIPRepository
 from src.dependencies import get_vip_repository
 from src.schemas.vip import VIPLevel
 
 router = APIRouter(prefix="/vip", tags=["vip"])
 
+# VIP bonuses are static game configuration, cached like the troop stats.
+_vip_cache = TTLCache(ttl=300)
+_VIP_LIST = TypeAdapter(List[VIPLevel])
+
+
+async def _all_levels(repo: VIPRepository) -> List[VIPLevel]:
+    """Return every VIP level, loading the whole table at most once per TTL.
+
+    There are only a dozen levels, so range and single-level lookups slice
+    this list and serialize the result per request instead of caching their
+    own response bodies, which could outlive the list they were built from.
+    """
+    return await _vip_cache.get_or_load("levels", repo.get_all)
+
 
 @router.get("/", response_model=List[VIPLevel])
-def get_all_vip_levels(
+async def get_all_vip_levels(
     min_level: int = Query(1, ge=1, le=12, description="Minimum VIP level"),
     max_level: int = Query(12, ge=1, le=12, description="Maximum VIP level"),
     repo: VIPRepository = Depends(get_vip_repository),
-) -> List[VIPLevel]:
+) -> Response:
     """Get all VIP levels with optional range filtering.
 
     Returns VIP bonus data for consumption by wikis, calculators, or other tools.
@@ -34,14 +50,20 @@ def get_all_vip_levels(
     Returns:
         List of VIP levels with complete bonus data
     """
-    return repo.get_all(min_level=min_level, max_level=max_level)
+
+    levels = await _all_levels(repo)
+    selected = [vip for vip in levels if min_level <= vip.level <= max_level]
+    return Response(
+        content=_VIP_LIST.dump_json(selected, by_alias=True),
+        media_type="application/json",
+    )
 
 
 @router.get("/{level}", response_model=VIPLevel)
-def get_vip_level(
+async def get_vip_level(
     level: int = Path(..., ge=1, le=12, description="VIP level"),
     repo: VIPRepository = Depends(get_vip_repository),
-) -> VIPLevel:
+) -> Response:
     """Get specific VIP level bonus data.
 
     Args:
@@ -53,11 +75,17 @@ def get_vip_level(
     Raises:
         HTTPException: 404 if VIP level not found
     """
-    vip = repo.get_by_level(level)
+
+    levels = await _all_levels(repo)
+    vip = next((vip for vip in levels if vip.level == level), None)
 
     if not vip:
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail=f"VIP level {level} not found"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"VIP level {level} not found",
         )
 
-    return vip
+    return Response(
+        content=vip.model_dump_json(by_alias=True),
+        media_type="application/json",
+    )
@@ -35,8 +35,6 @@ class GovernorGear(GovernorGearBase):
     image_path: Optional[str] = Field(
         None, description="Path to gear icon in storage", exclude=True
     )
-    created_at: Optional[str] = Field(None, exclude=True)
-    updated_at: Optional[str] = Field(None, exclude=True)
 
     @computed_field
     @property
@@ -313,6 +311,14 @@ class GearStatsBreakdown(BaseModel):
     )
 
 
+class GearStatsTotals(BaseModel):
+    """Aggregated totals emitted as the final line of a streamed calculation"""
+
+    total_bonuses: Dict[str, Dict[str, float]] = Field(
+        ..., description="Aggregated total bonuses grouped by troop type"
+    )
+
+
 class GearStatsCalculation(BaseModel):
     """Result of gear stat calculation"""
 
@@ -1,5 +1,6 @@
 """Hero API schemas."""
 
+from functools import cached_property
 from typing import List, Optional
 from uuid import UUID
 
@@ -32,9 +33,9 @@ class HeroBasicResponse(BaseModel):
     )
 
     @computed_field
-    @property
+    @cached_property
     def image_url(self) -> str | None:
-        """Public URL for hero image."""
+        """Public URL for hero image (resolved once per instance)."""
         path = resolve_asset_path(
             self.image_path,
             folder="heroes",
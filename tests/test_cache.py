@@ -0,0 +1,119 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.cache import TTLCache, clear_caches
+
+
+def test_ttl_cache_reuses_fresh_values():
+    asyncio.run(run_fresh_values_test())
+
+
+async def run_fresh_values_test():
+    cache = TTLCache(ttl=60)
+    loader = AsyncMock(return_value=b"[]")
+
+    assert await cache.get_or_load("skills", loader) == b"[]"
+    assert await cache.get_or_load("skills", loader) == b"[]"
+    assert loader.await_count == 1
+
+    await cache.get_or_load("talents", loader)
+    assert loader.await_count == 2
+
+
+def test_ttl_cache_serves_stale_value_when_reload_fails():
+    asyncio.run(run_stale_on_error_test())
+
+
+async def run_stale_on_error_test():
+    cache = TTLCache(ttl=0)
+    await cache.get_or_load("skills", AsyncMock(return_value=b"old"))
+
+    failing = AsyncMock(side_effect=RuntimeError("supabase down"))
+    assert await cache.get_or_load("skills", failing) == b"old"
+
+    with pytest.raises(RuntimeError):
+        await cache.get_or_load("talents", failing)
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    cache = TTLCache(ttl=60, maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.set("c", 3)
+
+    loader = AsyncMock(return_value=10)
+    assert asyncio.run(cache.get_or_load("a", loader)) == 10
+    assert asyncio.run(cache.get_or_load("c", loader)) == 3
+
+
+def test_ttl_cache_does_not_store_missing_records():
+    asyncio.run(run_missing_records_test())
+
+
+async def run_missing_records_test():
+    cache = TTLCache(ttl=60)
+    loader = AsyncMock(return_value=None)
+
+    assert await cache.get_or_load("unknown-hero", loader) is None
+    assert await cache.get_or_load("unknown-hero", loader) is None
+    assert loader.await_count == 2
+
+
+def test_ttl_cache_refreshes_only_entries_in_use():
+    asyncio.run(run_refresh_test())
+
+
+async def run_refresh_test():
+    cache = TTLCache(ttl=60)
+    used = AsyncMock(side_effect=[b"v1", b"v2"])
+    unused = AsyncMock(return_value=b"x")
+    await cache.get_or_load("skills", used)
+    await cache.get_or_load("talents", unused)
+    await cache.get_or_load("skills", used)
+
+    await cache.refresh_due(within=120)
+
+    assert used.await_count == 2
+    assert unused.await_count == 1
+    assert await cache.get_or_load("skills", used) == b"v2"
+
+
+def test_ttl_cache_coalesces_concurrent_loads():
+    asyncio.run(run_single_flight_test())
+
+
+async def run_single_flight_test():
+    cache = TTLCache(ttl=60)
+    calls = 0
+
+    async def loader():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return b"[]"
+
+    results = await asyncio.gather(
+        *(cache.get_or_load("skills", loader) for _ in range(10))
+    )
+
+    assert results == [b"[]"] * 10
+    assert calls == 1
+
+
+def test_clear_caches_empties_every_cache():
+    asyncio.run(run_clear_caches_test())
+
+
+async def run_clear_caches_test():
+    first, second = TTLCache(ttl=60), TTLCache(ttl=60)
+    loader = AsyncMock(return_value=b"[]")
+    await first.get_or_load("skills", loader)
+    await second.get_or_load("talents", loader)
+
+    clear_caches()
+
+    await first.get_or_load("skills", loader)
+    await second.get_or_load("talents", loader)
+    assert loader.await_count == 4
@@ -1,9 +1,14 @@
 import asyncio
+import json
 from unittest.mock import AsyncMock
 
 import pytest
 
-from src.routes.governor_gear import calculate_gear_stats
+from src.routes.governor_gear import (
+    calculate_gear_stats,
+    reset_calculator_index,
+    stream_gear_stats,
+)
 from src.schemas.enums import GearRarity, HeroClass
 from src.schemas.governor_gear import (
     GearConfiguration,
@@ -13,12 +18,24 @@ from src.schemas.governor_gear import (
     GovernorGearLevel,
 )
 
+# Troop type per gear piece, matching real game logic
+GEAR_TROOP_TYPES = {
+    "head": HeroClass.CAVALRY,
+    "amulet": HeroClass.CAVALRY,
+    "chest": HeroClass.INFANTRY,
+    "legs": HeroClass.INFANTRY,
+    "ring": HeroClass.ARCHER,
+    "staff": HeroClass.ARCHER,
+}
+
 
 def test_calculate_gear_stats():
     asyncio.run(run_async_test())
 
 
 async def run_async_test():
+    reset_calculator_index()
+
     # Mock Repository
     repo = AsyncMock()
 
@@ -57,15 +74,7 @@ async def run_async_test():
 
     # Mock Gear Data
     all_gear = []
-    gear_troop_types = {
-        "head": HeroClass.CAVALRY,
-        "amulet": HeroClass.CAVALRY,
-        "chest": HeroClass.INFANTRY,
-        "legs": HeroClass.INFANTRY,
-        "ring": HeroClass.ARCHER,
-        "staff": HeroClass.ARCHER,
-    }
-    for gear_id, troop_type in gear_troop_types.items():
+    for gear_id, troop_type in GEAR_TROOP_TYPES.items():
         all_gear.append(
             GovernorGear(
                 gear_id=gear_id,
@@ -91,24 +100,14 @@ async def run_async_test():
     repo.get_all_charm_levels.return_value = charm_levels
 
     charm_slots = []
-    # Define troop types per gear piece to match real game logic
-    gear_troop_types = {
-        "head": HeroClass.CAVALRY,
-        "amulet": HeroClass.CAVALRY,
-        "chest": HeroClass.INFANTRY,
-        "legs": HeroClass.INFANTRY,
-        "ring": HeroClass.ARCHER,
-        "staff": HeroClass.ARCHER,
-    }
-
-    for gear_id in ["head", "amulet", "chest", "legs", "ring", "staff"]:
+    for gear_id in GEAR_TROOP_TYPES:
         for i in range(1, 4):
             charm_slots.append(
                 GovernorGearCharmSlot(
                     id=1,
                     gear_id=gear_id,
                     slot_index=i,
-                    troop_type=gear_troop_types[gear_id],
+                    troop_type=GEAR_TROOP_TYPES[gear_id],
                     bonus_keys=["troop_lethality_pct", "troop_health_pct"],
                 )
             )
@@ -231,3 +230,69 @@ async def run_async_test():
         abs(result.total_bonuses.get("archer", {}).get("lethality_pct", 0) - 73.0)
         < 0.01
     )
+
+
+def _single_head_repo():
+    """Return a mocked repository with one head piece and one Uncommon level."""
+    repo = AsyncMock()
+    repo.get_all_gear.return_value = [
+        GovernorGear(gear_id="head", slot="Head", troop_type=HeroClass.CAVALRY)
+    ]
+    repo.get_all_levels.return_value = [
+        GovernorGearLevel(
+            level=1,
+            rarity=GearRarity.UNCOMMON,
+            tier=0,
+            stars=0,
+            bonuses={"attack_pct": 1.5},
+        )
+    ]
+    repo.get_all_charm_levels.return_value = []
+    repo.get_all_charm_slots.return_value = []
+    return repo
+
+
+def test_calculate_gear_stats_reuses_reference_index():
+    asyncio.run(run_cached_index_test())
+
+
+async def run_cached_index_test():
+    reset_calculator_index()
+
+    repo = _single_head_repo()
+
+    config = [GearConfiguration(gear_id="head", rarity=GearRarity.UNCOMMON)]
+    first = await calculate_gear_stats(config, repo)
+    second = await calculate_gear_stats(config, repo)
+
+    assert (
+        first.total_bonuses == second.total_bonuses == {"cavalry": {"attack_pct": 1.5}}
+    )
+    assert repo.get_all_levels.await_count == 1
+
+    reset_calculator_index()
+    await calculate_gear_stats(config, repo)
+    assert repo.get_all_levels.await_count == 2
+
+
+def test_stream_gear_stats_matches_calculation():
+    asyncio.run(run_stream_test())
+
+
+async def run_stream_test():
+    reset_calculator_index()
+
+    repo = _single_head_repo()
+
+    config = [
+        GearConfiguration(gear_id="head", rarity=GearRarity.UNCOMMON),
+        GearConfiguration(gear_id="missing", rarity=GearRarity.UNCOMMON),
+    ]
+    expected = await calculate_gear_stats(config, repo)
+
+    response = await stream_gear_stats(config, repo)
+    assert response.media_type == "application/x-ndjson"
+    lines = [json.loads(chunk) async for chunk in response.body_iterator]
+
+    assert lines[:-1] == [item.model_dump(mode="json") for item in expected.breakdown]
+    assert lines[-1] == {"total_bonuses": expected.total_bonuses}
@@ -0,0 +1,114 @@
+import asyncio
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+
+from src.routes.heroes import get_hero_bundle, get_hero_skills
+from src.schemas.exclusive_gear import HeroExclusiveGearResponse
+from src.schemas.hero import HeroBasicResponse
+from src.schemas.skills import HeroSkillResponse
+from src.schemas.stats import ConquestStatsResponse, ExpeditionStatsResponse
+from src.schemas.talent import HeroTalentResponse
+
+HERO_ID = uuid4()
+
+
+def _skill(name, battle_type):
+    return HeroSkillResponse(
+        id=uuid4(),
+        hero_id=HERO_ID,
+        name=name,
+        skill_type="Active",
+        battle_type=battle_type,
+        description=f"{name} description",
+    )
+
+
+def test_get_hero_bundle():
+    asyncio.run(run_bundle_test())
+
+
+async def run_bundle_test():
+    hero = HeroBasicResponse.model_validate(
+        {
+            "id": HERO_ID,
+            "hero_id_slug": "jabel",
+            "name": "Jabel",
+            "rarity": "Epic",
+            "generation": 1,
+            "class": "Cavalry",
+            "image_path": "heroes/jabel/custom.png",
+        }
+    )
+    hero_repo = AsyncMock()
+    hero_repo.get_by_slug.return_value = hero
+
+    skills_repo = AsyncMock()
+    skills_repo.list_by_hero_slug.return_value = [
+        _skill("Charge", "Conquest"),
+        _skill("Rally", "Expedition"),
+        _skill("Guard", "Conquest"),
+    ]
+    gear_repo = AsyncMock()
+    gear_repo.list_by_hero_slug.return_value = [
+        HeroExclusiveGearResponse.model_validate(
+            {"id": uuid4(), "hero_id": HERO_ID, "name": "Jabel's Lance"}
+        )
+    ]
+    talent_repo = AsyncMock()
+    talent_repo.list_by_hero_slug.return_value = [
+        HeroTalentResponse(
+            id=uuid4(), hero_id=HERO_ID, name="Vanguard", description="Talent"
+        )
+    ]
+    conquest_repo = AsyncMock()
+    conquest_repo.list_by_hero_slug.return_value = [
+        ConquestStatsResponse(attack=100, defense=90, health=80)
+    ]
+    expedition_repo = AsyncMock()
+    expedition_repo.list_by_hero_slug.return_value = [
+        ExpeditionStatsResponse(troop_type="Cavalry", attack_pct=10.0, defense_pct=5.0)
+    ]
+
+    bundle = await get_hero_bundle(
+        "jabel",
+        hero_repo,
+        skills_repo,
+        gear_repo,
+        talent_repo,
+        conquest_repo,
+        expedition_repo,
+    )
+
+    assert bundle.id == HERO_ID
+    assert bundle.class_ == "Cavalry"
+    assert bundle.image_url == hero.image_url
+    assert [s.name for s in bundle.conquest_skills] == ["Charge", "Guard"]
+    assert [s.name for s in bundle.expedition_skills] == ["Rally"]
+    assert bundle.exclusive_gear.name == "Jabel's Lance"
+    assert [t.name for t in bundle.talents] == ["Vanguard"]
+    assert bundle.conquest_stats[0].attack == 100
+    assert bundle.expedition_stats[0].troop_type == "Cavalry"
+
+
+def test_missing_hero_cancels_sibling_queries():
+    asyncio.run(run_missing_hero_test())
+
+
+async def run_missing_hero_test():
+    hero_repo = AsyncMock()
+    hero_repo.get_by_slug.return_value = None
+
+    async def slow_skills(_slug):
+        await asyncio.sleep(10)
+
+    skills_repo = AsyncMock()
+    skills_repo.list_by_hero_slug.side_effect = slow_skills
+
+    with pytest.raises(HTTPException) as exc_info:
+        await get_hero_skills("unknown", hero_repo, skills_repo)
+
+    assert exc_info.value.status_code == 404
+    assert asyncio.all_tasks() == {asyncio.current_task()}
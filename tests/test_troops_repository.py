@@ -0,0 +1,100 @@
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+from src.db.repositories.troops import TroopsRepository
+
+
+def _troop(troop_id, troop_type, troop_level, true_gold_level=0):
+    return {
+        "id": troop_id,
+        "troop_type": troop_type,
+        "troop_level": troop_level,
+        "true_gold_level": true_gold_level,
+        "attack": 1,
+        "defense": 1,
+        "health": 1,
+        "lethality": 1,
+        "power": 1,
+        "load": 1,
+        "speed": 1,
+    }
+
+
+def _cost(troop_type, troop_level, resource_id, cost):
+    return {
+        "troop_type": troop_type,
+        "troop_level": troop_level,
+        "resource_id": resource_id,
+        "cost": cost,
+    }
+
+
+def _points(troop_type, troop_level, event_id, base_points):
+    return {
+        "troop_type": troop_type,
+        "troop_level": troop_level,
+        "event_id": event_id,
+        "base_points": base_points,
+    }
+
+
+def _mock_client(rows_by_table):
+    """Return a client whose query builders resolve to ``rows_by_table``."""
+
+    def table(name):
+        query = MagicMock()
+        for method in ("select", "eq", "in_", "gte", "lte", "order", "limit"):
+            getattr(query, method).return_value = query
+        query.execute = AsyncMock(
+            return_value=SimpleNamespace(data=rows_by_table[name])
+        )
+        return query
+
+    client = MagicMock()
+    client.table.side_effect = table
+    return client
+
+
+def test_get_all_attaches_enrichment_per_type_and_level():
+    asyncio.run(run_enrichment_test())
+
+
+async def run_enrichment_test():
+    client = _mock_client(
+        {
+            "troops": [
+                _troop(1, "Infantry", 1, 0),
+                _troop(2, "Infantry", 1, 1),
+                _troop(3, "Infantry", 2),
+                _troop(4, "Cavalry", 1),
+                _troop(5, "Archer", 3),
+            ],
+            "troop_training_costs": [
+                _cost("Infantry", 1, "bread", 10),
+                _cost("Infantry", 1, "wood", 11),
+                _cost("Infantry", 2, "bread", 20),
+                _cost("Cavalry", 1, "bread", 30),
+            ],
+            "troop_event_points": [
+                _points("Infantry", 1, "hog", 5),
+                _points("Cavalry", 1, "hog", 7),
+            ],
+        }
+    )
+
+    troops = await TroopsRepository(client).get_all()
+    by_id = {troop.id: troop for troop in troops}
+
+    # Both True Gold tiers of the same type and level share one cost row set
+    assert by_id[1].training_costs == {"bread": 10, "wood": 11}
+    assert by_id[2].training_costs == {"bread": 10, "wood": 11}
+    assert by_id[1].event_points == {"hog": 5}
+    assert by_id[3].training_costs == {"bread": 20}
+    assert by_id[3].event_points == {}
+    # Same level as Infantry 1 but a different type
+    assert by_id[4].training_costs == {"bread": 30}
+    assert by_id[4].event_points == {"hog": 7}
+    # No enrichment rows at all
+    assert by_id[5].training_costs == {}
+    assert by_id[5].event_points == {}